@@ -19,6 +19,7 @@ class Settings(BaseSettings):
     # Database
     supabase_url: str
     supabase_service_key: str
+    supabase_direct_dsn: str | None = None  # Direct Postgres DSN for COPY bulk loads
 
     # AI
     openai_api_key: str
@@ -48,11 +49,15 @@ class Settings(BaseSettings):
     rate_limit_per_minute: int = 60
     rate_limit_per_hour: int = 1000
 
+    # Health Checks
+    health_cache_ttl: int = 30  # Seconds to cache readiness probe results
+
     # CORS
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:5173"]
 
     # Background Jobs
     enable_background_jobs: bool = False  # Set to True in production
+    trust_recalc_concurrency: int = 5  # Parallel trust recalculations per run
 
     # Development/Testing Options
     use_mock_prices: bool = False  # Set to True to skip Apify and use mock price data
@@ -7,11 +7,14 @@ Cost-optimized configuration for worker discovery in Bali:
 - Safety limits: Max 20 results per search, max 5 searches per run
 """
 
+import re
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from apify_client import ApifyClient
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential_jitter
 
 from app.config import get_settings
 from app.integrations.supabase import save_scrape_job, update_scrape_job_status
@@ -49,9 +52,14 @@ WORKER_SEARCH_QUERIES = {
 }
 
 
+@lru_cache
 def get_apify_client() -> ApifyClient:
     """
-    Get initialized Apify client.
+    Get singleton Apify client instance.
+
+    Constructed once and reused so repeat scrape invocations skip client
+    setup (auth headers, connection state), matching the cached Supabase
+    client in app.integrations.supabase.
 
     Returns:
         ApifyClient: Configured Apify client instance
@@ -74,6 +82,10 @@ def create_optimized_search_input(
     - Limit results per search
     - Skip closed places
 
+    The configuration is pure-functional of its inputs, so repeat builds
+    (4 specializations x recurring refresh runs) are served from an LRU
+    cache; callers get a fresh copy they can safely mutate.
+
     Args:
         search_queries: List of search strings
         location: Location to search in
@@ -83,9 +95,25 @@ def create_optimized_search_input(
     Returns:
         dict: Apify actor input configuration
     """
+    cached = _cached_search_input(
+        tuple(search_queries[:MAX_SEARCHES_PER_RUN]), location, max_results, min_rating
+    )
+    actor_input = dict(cached)
+    actor_input["searchStringsArray"] = list(actor_input["searchStringsArray"])
+    return actor_input
+
+
+@lru_cache(maxsize=32)
+def _cached_search_input(
+    search_queries: tuple[str, ...],
+    location: str,
+    max_results: int,
+    min_rating: float,
+) -> dict[str, Any]:
+    """Build the actor input for a hashable key (treated as immutable)"""
     return {
         # Search configuration
-        "searchStringsArray": search_queries[:MAX_SEARCHES_PER_RUN],
+        "searchStringsArray": search_queries,
         "locationQuery": location,
         "maxCrawledPlacesPerSearch": min(max_results, MAX_RESULTS_PER_SEARCH),
         "language": "en",
@@ -114,11 +142,15 @@ def create_optimized_search_input(
     }
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-    reraise=True,
-)
+# Per-type Apify inputs with default filters, built once at import so scrape
+# runs with default parameters reuse the invariant configuration instead of
+# rebuilding it on every call.
+_DEFAULT_INPUT_BY_TYPE = {
+    project_type: create_optimized_search_input(queries)
+    for project_type, queries in WORKER_SEARCH_QUERIES.items()
+}
+
+
 async def scrape_google_maps_workers(
     project_type: str,
     location: str = "Bali, Indonesia",
@@ -152,13 +184,22 @@ async def scrape_google_maps_workers(
 
     search_queries = WORKER_SEARCH_QUERIES[project_type]
 
-    # Create optimized input configuration
-    actor_input = create_optimized_search_input(
-        search_queries=search_queries,
-        location=location,
-        max_results=max_results_per_search,
-        min_rating=min_rating,
-    )
+    # Create optimized input configuration (precomputed table for defaults)
+    if (
+        location == "Bali, Indonesia"
+        and max_results_per_search == MAX_RESULTS_PER_SEARCH
+        and min_rating == 4.0
+    ):
+        actor_input = dict(_DEFAULT_INPUT_BY_TYPE[project_type])
+        # Copy the one mutable value so job records never share state
+        actor_input["searchStringsArray"] = list(actor_input["searchStringsArray"])
+    else:
+        actor_input = create_optimized_search_input(
+            search_queries=search_queries,
+            location=location,
+            max_results=max_results_per_search,
+            min_rating=min_rating,
+        )
 
     # Estimate cost (base rate: $0.004 per place)
     estimated_places = len(search_queries[:MAX_SEARCHES_PER_RUN]) * min(
@@ -178,8 +219,20 @@ async def scrape_google_maps_workers(
         # Initialize Apify client
         client = get_apify_client()
 
-        # Start the actor run
-        run = client.actor("compass/crawler-google-places").call(run_input=actor_input)
+        # Start the actor run, retrying transient failures with exponential
+        # backoff + jitter so throttled runs back off instead of hammering
+        # the endpoint. Retry wraps only this call - the job record is
+        # created once and the failed status is persisted once, on the
+        # final attempt.
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(3),
+            wait=wait_exponential_jitter(initial=1, max=30),
+            reraise=True,
+        ):
+            with attempt:
+                run = client.actor("compass/crawler-google-places").call(
+                    run_input=actor_input
+                )
 
         # Update job with run ID
         await update_scrape_job_status(
@@ -189,11 +242,24 @@ async def scrape_google_maps_workers(
             started_at=datetime.utcnow().isoformat(),
         )
 
-        # Fetch results from dataset
+        # Stream results from the dataset through transform + exact-key
+        # dedup in a single pass, so duplicate places (the same business
+        # surfacing under several search queries) never materialize.
+        # Keyed on gmaps_place_id, falling back to (business_name, phone)
+        # for rows without one - O(N) set membership, no pairwise scans.
         results = []
+        seen_keys: set[Any] = set()
         for item in client.dataset(run["defaultDatasetId"]).iterate_items():
             # Transform Apify output to our schema
             worker_data = transform_gmaps_result(item)
+            key = worker_data["gmaps_place_id"] or (
+                worker_data["business_name"],
+                worker_data["phone"],
+            )
+            if key != (None, None):
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
             results.append(worker_data)
 
         # Update job as completed
@@ -219,6 +285,42 @@ async def scrape_google_maps_workers(
         raise
 
 
+@dataclass(slots=True)
+class GmapsWorker:
+    """
+    Transformed worker record in our schema, backed by __slots__.
+
+    Slotted storage drops the per-row dict overhead (~15 string keys per
+    result) while the scrape loop accumulates hundreds of entries that
+    are re-iterated for dedup, trust scoring and bulk insert.
+    """
+
+    business_name: str | None = None
+    source_tier: str = "google_maps"
+    # Contact
+    phone: str | None = None
+    website: str | None = None
+    whatsapp: str | None = None
+    email: str | None = None
+    # Location
+    location: str = "Bali"
+    address: str = ""
+    latitude: float | None = None
+    longitude: float | None = None
+    # Google Maps data
+    gmaps_place_id: str | None = None
+    gmaps_rating: float | None = None
+    gmaps_review_count: int = 0
+    gmaps_photos_count: int = 0
+    gmaps_url: str = ""
+    gmaps_categories: list[str] = field(default_factory=list)
+    # Specializations
+    specializations: list[str] = field(default_factory=list)
+    # Metadata
+    last_scraped_at: str = ""
+    is_active: bool = True
+
+
 def transform_gmaps_result(raw_data: dict[str, Any]) -> dict[str, Any]:
     """
     Transform Apify Google Maps output to our worker schema.
@@ -244,11 +346,23 @@ def transform_gmaps_result(raw_data: dict[str, Any]) -> dict[str, Any]:
     Returns:
         dict: Transformed worker profile matching our schema
     """
+    return asdict(transform_gmaps_result_obj(raw_data))
+
+
+def transform_gmaps_result_obj(raw_data: dict[str, Any]) -> GmapsWorker:
+    """
+    Transform Apify Google Maps output to a slotted GmapsWorker record.
+
+    Args:
+        raw_data: Raw result from Apify actor
+
+    Returns:
+        GmapsWorker: Transformed worker record
+    """
     # Extract place ID from URL (if available)
     url = raw_data.get("url", "")
-    place_id = None
-    if "query_place_id=" in url:
-        place_id = url.split("query_place_id=")[1].split("&")[0]
+    place_id_match = _PLACE_ID_RE.search(url)
+    place_id = place_id_match.group(1) if place_id_match else None
 
     # Build full address
     address_parts = [
@@ -262,38 +376,38 @@ def transform_gmaps_result(raw_data: dict[str, Any]) -> dict[str, Any]:
     category = raw_data.get("categoryName", "").lower()
     specializations = infer_specializations(category, raw_data.get("title", ""))
 
-    return {
-        "business_name": raw_data.get("title"),
-        "source_tier": "google_maps",
-        # Contact
-        "phone": raw_data.get("phone"),
-        "website": raw_data.get("website"),
-        "whatsapp": None,  # Not provided by Google Maps scraper
-        "email": None,  # Not provided in basic scraping
+    return GmapsWorker(
+        business_name=raw_data.get("title"),
+        # Contact (whatsapp/email not provided by basic Google Maps scraping)
+        phone=raw_data.get("phone"),
+        website=raw_data.get("website"),
         # Location
-        "location": raw_data.get("city", "Bali"),  # Fallback to Bali
-        "address": full_address,
-        "latitude": raw_data.get("latitude"),
-        "longitude": raw_data.get("longitude"),
+        location=raw_data.get("city", "Bali"),  # Fallback to Bali
+        address=full_address,
+        latitude=raw_data.get("latitude"),
+        longitude=raw_data.get("longitude"),
         # Google Maps data
-        "gmaps_place_id": place_id,
-        "gmaps_rating": raw_data.get("totalScore"),
-        "gmaps_review_count": raw_data.get("reviewsCount", 0),
-        "gmaps_photos_count": 0,  # Not available without detailed scraping
-        "gmaps_url": url,
-        "gmaps_categories": [raw_data.get("categoryName")] if raw_data.get("categoryName") else [],
+        gmaps_place_id=place_id,
+        gmaps_rating=raw_data.get("totalScore"),
+        gmaps_review_count=raw_data.get("reviewsCount", 0),
+        gmaps_photos_count=0,  # Not available without detailed scraping
+        gmaps_url=url,
+        gmaps_categories=[raw_data.get("categoryName")] if raw_data.get("categoryName") else [],
         # Specializations
-        "specializations": specializations,
+        specializations=specializations,
         # Metadata
-        "last_scraped_at": datetime.utcnow().isoformat(),
-        "is_active": True,
-    }
+        last_scraped_at=datetime.utcnow().isoformat(),
+    )
 
 
 def infer_specializations(category: str, title: str) -> list[str]:
     """
     Infer worker specializations from Google Maps category and business title.
 
+    Results are memoized on the lowercased inputs: category names repeat
+    heavily across scraped rows ("Swimming pool contractor" etc.), so
+    repeat calls skip the keyword scans entirely.
+
     Args:
         category: Google Maps category name
         title: Business title/name
@@ -301,41 +415,36 @@ def infer_specializations(category: str, title: str) -> list[str]:
     Returns:
         list[str]: Inferred specializations
     """
-    specializations = set()
-    combined_text = f"{category} {title}".lower()
+    return list(_infer_specializations(category.lower(), title.lower()))
+
+
+# Precompiled place-id extractor for Google Maps URLs. One C-level regex
+# scan per row instead of split() allocations.
+_PLACE_ID_RE = re.compile(r"[?&]query_place_id=([^&#]+)")
+
+# Precompiled keyword alternations per specialization, built once at
+# import. One C-level regex scan per specialization replaces the
+# per-keyword Python `in` checks in the per-row scrape loop.
+_SPECIALIZATION_PATTERNS = {
+    "pool": re.compile(r"pool|kolam|swimming|renang"),
+    "bathroom": re.compile(r"bathroom|kamar mandi|plumbing|toilet"),
+    "kitchen": re.compile(r"kitchen|dapur"),
+    "general": re.compile(
+        r"construction|contractor|builder|tukang|renovasi|renovation|bangunan"
+    ),
+}
 
-    # Pool-related keywords
-    if any(
-        keyword in combined_text
-        for keyword in ["pool", "kolam", "swimming", "renang"]
-    ):
-        specializations.add("pool")
 
-    # Bathroom-related keywords
-    if any(
-        keyword in combined_text
-        for keyword in ["bathroom", "kamar mandi", "plumbing", "toilet"]
-    ):
-        specializations.add("bathroom")
-
-    # Kitchen-related keywords
-    if any(keyword in combined_text for keyword in ["kitchen", "dapur"]):
-        specializations.add("kitchen")
-
-    # Construction/general contractor keywords
-    if any(
-        keyword in combined_text
-        for keyword in [
-            "construction",
-            "contractor",
-            "builder",
-            "tukang",
-            "renovasi",
-            "renovation",
-            "bangunan",
-        ]
-    ):
-        specializations.add("general")
+@lru_cache(maxsize=4096)
+def _infer_specializations(category: str, title: str) -> tuple[str, ...]:
+    """Keyword-scan kernel for infer_specializations (expects lowercased inputs)."""
+    combined_text = f"{category} {title}"
+
+    specializations = tuple(
+        spec
+        for spec, pattern in _SPECIALIZATION_PATTERNS.items()
+        if pattern.search(combined_text)
+    )
 
     # Default to general if no specific specialization found
-    return list(specializations) if specializations else ["general"]
+    return specializations or ("general",)
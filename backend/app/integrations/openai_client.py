@@ -5,6 +5,14 @@ OpenAI GPT-4o-mini client with prompt caching for BOM generation
 import json
 from functools import lru_cache
 
+try:
+    # orjson parses large JSON payloads several times faster than stdlib json.
+    # Its JSONDecodeError subclasses json.JSONDecodeError, so error handling
+    # below works with either parser.
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    json_loads = json.loads
+
 from openai import AsyncOpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -119,7 +127,7 @@ Location: {project_input.get('location', 'Bali')}
             raise ValueError("Empty response from OpenAI")
 
         # Parse JSON response
-        result = json.loads(content)
+        result = json_loads(content)
 
         # Handle both direct array and wrapped responses
         if isinstance(result, dict) and "materials" in result:
@@ -10,6 +10,8 @@ Tables:
 - scrape_jobs: Apify job tracking
 """
 
+import asyncio
+from datetime import datetime, timezone
 from functools import lru_cache
 
 from supabase import create_client, Client
@@ -229,7 +231,10 @@ async def update_material_prices(
         "price_max": price_max,
         "price_avg": price_avg,
         "price_sample_size": sample_size,
-        "price_updated_at": "now()"
+        # ISO timestamp computed client-side: a plain timestamptz literal
+        # casts for free, where the "now()" string leans on expression
+        # parsing in the column cast
+        "price_updated_at": datetime.now(timezone.utc).isoformat()
     }).eq("id", material_id).execute()
 
 
@@ -414,7 +419,7 @@ async def save_material_price_cache(
         "price_avg": price_avg,
         "price_median": price_median,
         "price_sample_size": sample_size,
-        "price_updated_at": "now()",
+        "price_updated_at": datetime.now(timezone.utc).isoformat(),
         # New seller quality fields
         "rating_avg": seller_stats.get("rating_avg"),
         "rating_sample_size": seller_stats.get("rating_sample_size", 0),
@@ -651,6 +656,32 @@ async def save_worker(worker_data: dict) -> dict:
     return response.data[0] if response.data else {}
 
 
+async def bulk_update_worker_trust(updates: list[dict]) -> int:
+    """
+    Update trust scores for many workers in one round trip.
+
+    Each update dict carries id, trust_score, trust_level and
+    trust_breakdown; the bulk_update_trust SQL function applies the
+    whole batch in a single set-oriented UPDATE and stamps
+    last_score_calculated_at server-side.
+    See migrations/007_bulk_update_trust_rpc.sql.
+
+    Args:
+        updates: List of trust update dictionaries
+
+    Returns:
+        int: Number of workers updated
+    """
+    if not updates:
+        return 0
+
+    supabase = get_supabase_client()
+    response = await asyncio.to_thread(
+        supabase.rpc("bulk_update_trust", {"payload": updates}).execute
+    )
+    return response.data or 0
+
+
 async def update_worker_trust(
     worker_id: str,
     trust_score: int,
@@ -660,30 +691,154 @@ async def update_worker_trust(
     """
     Update worker's trust score
 
+    Thin wrapper over bulk_update_worker_trust for single-worker callers.
+
     Args:
         worker_id: UUID of the worker
         trust_score: Calculated score (0-100)
         trust_level: Level (low, medium, high, verified)
         trust_breakdown: Detailed score breakdown
     """
-    supabase = get_supabase_client()
-    supabase.table("workers").update({
+    await bulk_update_worker_trust([{
+        "id": worker_id,
         "trust_score": trust_score,
         "trust_level": trust_level,
         "trust_breakdown": trust_breakdown,
-        "last_score_calculated_at": "now()"
-    }).eq("id", worker_id).execute()
+    }])
+
+
+# Rows per upsert request. PostgREST degrades sharply past ~1000 rows
+# per payload; a few hundred keeps each request well within limits.
+INSERT_CHUNK_SIZE = 400
+
+# Columns streamed into workers_staging by the COPY bulk-load path
+# (migration 009); order must match _worker_copy_record below.
+_COPY_COLUMNS = (
+    "business_name",
+    "source_tier",
+    "phone",
+    "whatsapp",
+    "email",
+    "website",
+    "location",
+    "address",
+    "latitude",
+    "longitude",
+    "gmaps_place_id",
+    "gmaps_rating",
+    "gmaps_review_count",
+    "gmaps_photos_count",
+    "gmaps_url",
+    "gmaps_categories",
+    "specializations",
+    "is_active",
+)
+
+_COPY_MERGE_SQL = f"""
+    INSERT INTO workers ({", ".join(_COPY_COLUMNS)}, last_scraped_at)
+    SELECT {", ".join(_COPY_COLUMNS)}, now()
+    FROM workers_staging
+    ON CONFLICT (gmaps_place_id) DO UPDATE SET
+        business_name = EXCLUDED.business_name,
+        phone = EXCLUDED.phone,
+        whatsapp = EXCLUDED.whatsapp,
+        email = EXCLUDED.email,
+        website = EXCLUDED.website,
+        location = EXCLUDED.location,
+        address = EXCLUDED.address,
+        latitude = EXCLUDED.latitude,
+        longitude = EXCLUDED.longitude,
+        gmaps_rating = EXCLUDED.gmaps_rating,
+        gmaps_review_count = EXCLUDED.gmaps_review_count,
+        gmaps_photos_count = EXCLUDED.gmaps_photos_count,
+        gmaps_url = EXCLUDED.gmaps_url,
+        gmaps_categories = EXCLUDED.gmaps_categories,
+        specializations = EXCLUDED.specializations,
+        last_scraped_at = now(),
+        updated_at = now()
+"""
+
+
+def _worker_copy_record(worker: dict) -> tuple:
+    """One workers_staging record, field order matching _COPY_COLUMNS"""
+    return (
+        worker.get("business_name"),
+        worker.get("source_tier", "google_maps"),
+        worker.get("phone"),
+        worker.get("whatsapp"),
+        worker.get("email"),
+        worker.get("website"),
+        worker.get("location"),
+        worker.get("address"),
+        worker.get("latitude"),
+        worker.get("longitude"),
+        worker.get("gmaps_place_id"),
+        worker.get("gmaps_rating"),
+        worker.get("gmaps_review_count", 0),
+        worker.get("gmaps_photos_count", 0),
+        worker.get("gmaps_url"),
+        worker.get("gmaps_categories", []),
+        worker.get("specializations", []),
+        worker.get("is_active", True),
+    )
+
+
+async def _copy_insert_workers(workers: list[dict]) -> list[dict]:
+    """
+    COPY-stream workers over a direct Postgres connection.
+
+    Bypasses PostgREST entirely: records land in the unlogged
+    workers_staging table via the COPY protocol, then one set-oriented
+    INSERT ... ON CONFLICT merges them into workers. Requires
+    supabase_direct_dsn and the optional asyncpg dependency.
+    """
+    import asyncpg  # Imported lazily - only the copy path needs it
+
+    settings = get_settings()
+    if not settings.supabase_direct_dsn:
+        raise ValueError("bulk_insert_workers(mode='copy') requires supabase_direct_dsn")
+
+    conn = await asyncpg.connect(settings.supabase_direct_dsn)
+    try:
+        await conn.execute("TRUNCATE workers_staging")
+        await conn.copy_records_to_table(
+            "workers_staging",
+            records=[_worker_copy_record(worker) for worker in workers],
+            columns=list(_COPY_COLUMNS),
+        )
+        await conn.execute(_COPY_MERGE_SQL)
+        await conn.execute("TRUNCATE workers_staging")
+    finally:
+        await conn.close()
 
+    return workers
 
-async def bulk_insert_workers(workers: list[dict]) -> list[dict]:
+
+async def bulk_insert_workers(
+    workers: list[dict],
+    chunk_size: int = INSERT_CHUNK_SIZE,
+    max_concurrent: int = 4,
+    mode: str = "upsert",
+) -> list[dict]:
     """
     Insert multiple workers at once (for scraper results).
 
     Handles deduplication by checking gmaps_place_id uniqueness.
     On conflict, updates existing records instead of inserting.
+    Large batches are uploaded in chunks to stay within PostgREST
+    payload limits; chunks are sent concurrently (bounded by a
+    semaphore) and each request runs in a worker thread since the
+    Supabase client is synchronous.
+
+    mode="copy" streams the batch over a direct Postgres connection
+    with the COPY protocol instead - far faster for cold-start loads
+    of tens of thousands of rows, but needs supabase_direct_dsn.
 
     Args:
         workers: List of worker dictionaries
+        chunk_size: Maximum rows per upsert request
+        max_concurrent: Maximum upsert requests in flight at once
+        mode: "upsert" (PostgREST, default) or "copy" (direct COPY)
 
     Returns:
         list[dict]: Inserted/updated worker records
@@ -691,15 +846,35 @@ async def bulk_insert_workers(workers: list[dict]) -> list[dict]:
     if not workers:
         return []
 
+    if mode == "copy":
+        return await _copy_insert_workers(workers)
+
     supabase = get_supabase_client()
+    semaphore = asyncio.Semaphore(max_concurrent)
 
-    # Use upsert with gmaps_place_id as conflict target
-    response = (
-        supabase.table("workers")
-        .upsert(workers, on_conflict="gmaps_place_id")
-        .execute()
-    )
-    return response.data if response.data else []
+    def _upsert(chunk: list[dict]):
+        return (
+            supabase.table("workers")
+            .upsert(chunk, on_conflict="gmaps_place_id")
+            .execute()
+        )
+
+    async def _upsert_chunk(chunk: list[dict]):
+        async with semaphore:
+            return await asyncio.to_thread(_upsert, chunk)
+
+    # Use upsert with gmaps_place_id as conflict target, chunks in parallel
+    chunks = [
+        workers[i : i + chunk_size] for i in range(0, len(workers), chunk_size)
+    ]
+    responses = await asyncio.gather(*(_upsert_chunk(chunk) for chunk in chunks))
+
+    inserted: list[dict] = []
+    for response in responses:
+        if response.data:
+            inserted.extend(response.data)
+
+    return inserted
 
 
 async def get_cached_workers(
@@ -716,25 +891,25 @@ async def get_cached_workers(
     Returns:
         list[dict] | None: Cached workers if fresh, None if stale/missing
     """
-    from datetime import datetime, timedelta, timezone
-
     supabase = get_supabase_client()
-    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
 
-    response = (
-        supabase.table("workers")
-        .select("*")
-        .contains("specializations", [specialization])
-        .eq("is_active", True)
-        .gte("last_scraped_at", cutoff_time.isoformat())
-        .order("trust_score", desc=True)
-        .execute()
+    # Single RPC: the freshness cutoff is evaluated server-side and the
+    # verdict comes back with the rows, so a cache miss costs one round
+    # trip instead of a SELECT that exists only to return nothing.
+    # See migrations/006_get_cached_workers_rpc.sql.
+    response = await asyncio.to_thread(
+        supabase.rpc(
+            "get_cached_workers_or_nothing",
+            {"spec": specialization, "max_age_hours": max_age_hours},
+        ).execute
     )
 
-    results = response.data if response.data else []
+    result = response.data or {}
 
-    # Return None if no results (cache miss), otherwise return workers
-    return results if results else None
+    # Return None on cache miss, otherwise the fresh workers
+    if not result.get("fresh"):
+        return None
+    return result.get("rows") or None
 
 
 async def update_worker_scraped_timestamp(worker_ids: list[str]) -> None:
@@ -751,12 +926,70 @@ async def update_worker_scraped_timestamp(worker_ids: list[str]) -> None:
 
     supabase = get_supabase_client()
 
-    # Batch update using IN clause
+    # Batch update using IN clause, off the event loop
     now = datetime.now(timezone.utc).isoformat()
-    supabase.table("workers").update({
-        "last_scraped_at": now,
-        "updated_at": now
-    }).in_("id", worker_ids).execute()
+    await asyncio.to_thread(
+        supabase.table("workers").update({
+            "last_scraped_at": now,
+            "updated_at": now
+        }).in_("id", worker_ids).execute
+    )
+
+
+class ScrapedTimestampBatcher:
+    """
+    Coalesces per-worker scraped-timestamp updates into bulk calls.
+
+    Scraper pipelines tend to report workers one at a time; instead of
+    one UPDATE per worker, queued IDs accumulate for a short window (or
+    until max_batch) and flush as a single
+    update_worker_scraped_timestamp call.
+    """
+
+    def __init__(self, window_ms: int = 100, max_batch: int = 1000):
+        self._window_s = window_ms / 1000
+        self._max_batch = max_batch
+        self._queue: list[str] = []
+        self._flush_task: asyncio.Task | None = None
+
+    async def add(self, worker_id: str) -> None:
+        """Queue one worker ID, flushing if the batch is full"""
+        self._queue.append(worker_id)
+        if len(self._queue) >= self._max_batch:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(self._window_s)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Send everything queued so far in one bulk update"""
+        if self._flush_task is not None:
+            task, self._flush_task = self._flush_task, None
+            if task is not asyncio.current_task():
+                task.cancel()
+
+        worker_ids, self._queue = self._queue, []
+        if worker_ids:
+            await update_worker_scraped_timestamp(worker_ids)
+
+
+_scraped_timestamp_batcher = ScrapedTimestampBatcher()
+
+
+async def queue_scraped_timestamp(worker_id: str) -> None:
+    """
+    Queue a single worker's scraped-timestamp update.
+
+    Per-row convenience over update_worker_scraped_timestamp: calls
+    landing within the same 100 ms window share one round trip.
+
+    Args:
+        worker_id: UUID of the worker
+    """
+    await _scraped_timestamp_batcher.add(worker_id)
 
 
 async def search_workers(
@@ -764,41 +997,47 @@ async def search_workers(
     location: str | None = None,
     min_trust_score: int = 0,
     min_rating: float = 0.0,
-    limit: int = 20
+    limit: int = 20,
+    cursor: tuple[int, str] | None = None,
 ) -> list[dict]:
     """
     Search workers with flexible filters.
 
+    Pagination is keyset-based on (trust_score DESC, id): pass the last
+    row of the previous page as cursor and the query seeks straight to
+    the next page via idx_workers_trust_id instead of re-sorting the
+    full filtered set (migrations 008 and 010).
+
     Args:
         specialization: Filter by specialization (pool, bathroom, etc.)
         location: Filter by location (Canggu, Ubud, etc.)
         min_trust_score: Minimum trust score (0-100)
         min_rating: Minimum Google Maps rating (0.0-5.0)
-        limit: Maximum results
+        limit: Maximum results per page
+        cursor: (trust_score, id) of the last row already seen, if paging
 
     Returns:
         list[dict]: Matching workers sorted by trust score
     """
     supabase = get_supabase_client()
-    query = supabase.table("workers").select("*").eq("is_active", True)
-
-    if specialization:
-        query = query.contains("specializations", [specialization])
-
-    if location:
-        query = query.ilike("location", f"%{location}%")
 
-    if min_trust_score > 0:
-        query = query.gte("trust_score", min_trust_score)
-
-    if min_rating > 0:
-        query = query.gte("gmaps_rating", min_rating)
+    # One RPC instead of a 7-stage filter chain: filters, keyset cursor,
+    # ordering and limit all live in rpc_search_workers, which Postgres
+    # plans once and reuses (see migrations/010_search_workers_rpc.sql)
+    params: dict = {
+        "spec": specialization or None,
+        "loc": location or None,
+        "min_trust": min_trust_score,
+        "min_rating": min_rating,
+        "lim": limit,
+    }
+    if cursor is not None:
+        params["last_trust"], params["last_id"] = cursor
 
-    response = (
-        query
-        .order("trust_score", desc=True)
-        .limit(limit)
-        .execute()
+    # The Supabase client is synchronous; run the request in a worker
+    # thread so concurrent searches don't serialize on the event loop
+    response = await asyncio.to_thread(
+        supabase.rpc("rpc_search_workers", params).execute
     )
 
     return response.data if response.data else []
@@ -1003,7 +1242,7 @@ async def update_affiliate_conversion(
         "converted": True,
         "conversion_amount": conversion_amount,
         "commission_earned": commission_earned,
-        "converted_at": "now()"
+        "converted_at": datetime.now(timezone.utc).isoformat()
     }).eq("id", click_id).execute()
 
 
@@ -2,13 +2,21 @@
 Health check and monitoring endpoints
 """
 
-from fastapi import APIRouter, status
+import time
+
+from fastapi import APIRouter, Response, status
 
 from app.config import get_settings
 from app.integrations.supabase import get_supabase_client
 
 router = APIRouter()
 
+# Cached readiness payload as (monotonic timestamp, body). Monitoring
+# pollers hit /health/ready every few seconds; serving the probe result
+# from cache for health_cache_ttl seconds keeps that traffic off the
+# database.
+_readiness_cache: tuple[float, dict] | None = None
+
 
 @router.get("/", status_code=status.HTTP_200_OK)
 async def health_check():
@@ -22,7 +30,7 @@ async def health_check():
 
 
 @router.get("/ready", status_code=status.HTTP_200_OK)
-async def readiness_check():
+async def readiness_check(response: Response):
     """
     Readiness check - are dependencies available?
 
@@ -30,9 +38,22 @@ async def readiness_check():
     - Database connection
     - Configuration loaded
 
+    Results are cached in-process for health_cache_ttl seconds; the
+    X-Cache header reports HIT or MISS.
+
     Returns:
         dict: Readiness status with dependency checks
     """
+    global _readiness_cache
+
+    ttl = get_settings().health_cache_ttl
+    response.headers["Cache-Control"] = f"max-age={ttl}"
+
+    now = time.monotonic()
+    if _readiness_cache is not None and now - _readiness_cache[0] < ttl:
+        response.headers["X-Cache"] = "HIT"
+        return _readiness_cache[1]
+
     checks = {"api": True, "config": True, "database": False}
 
     try:
@@ -45,11 +66,14 @@ async def readiness_check():
 
     all_ready = all(checks.values())
 
-    return {
+    body = {
         "status": "ready" if all_ready else "not_ready",
         "checks": checks,
         "ok": all_ready,
     }
+    _readiness_cache = (now, body)
+    response.headers["X-Cache"] = "MISS"
+    return body
 
 
 @router.get("/metrics", status_code=status.HTTP_200_OK)
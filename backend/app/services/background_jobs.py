@@ -12,6 +12,7 @@ For production scale, migrate to Celery + Redis.
 
 import asyncio
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -21,7 +22,9 @@ from apscheduler.triggers.interval import IntervalTrigger
 from app.config import get_settings
 from app.integrations.google_maps_scraper import scrape_google_maps_workers
 from app.integrations.supabase import (
+    INSERT_CHUNK_SIZE,
     bulk_insert_workers,
+    bulk_update_worker_trust,
     get_supabase_client,
     update_worker_scraped_timestamp,
 )
@@ -30,6 +33,10 @@ from app.services.worker_deduplication import deduplicate_workers
 
 settings = get_settings()
 
+# Page size for the stale-worker select. Keeps each PostgREST payload
+# bounded while staying large enough to amortize round-trips.
+STALE_WORKER_PAGE_SIZE = 500
+
 
 class BackgroundJobService:
     """
@@ -64,6 +71,9 @@ class BackgroundJobService:
             id="cache_refresh_weekly",
             name="Refresh popular worker caches",
             replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=300,
         )
 
         # Job 2: Trust score recalculation - Daily at 3 AM UTC
@@ -73,6 +83,9 @@ class BackgroundJobService:
             id="trust_recalc_daily",
             name="Recalculate stale trust scores",
             replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=300,
         )
 
         # Job 3: Cleanup old scrape jobs - Monthly on 1st at 4 AM UTC
@@ -82,6 +95,9 @@ class BackgroundJobService:
             id="cleanup_monthly",
             name="Clean up old scrape job records",
             replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=300,
         )
 
         self.scheduler.start()
@@ -112,12 +128,20 @@ class BackgroundJobService:
 
         print(f"[CACHE REFRESH] Starting refresh for {len(popular_specializations)} specializations")
 
-        for specialization in popular_specializations:
-            try:
-                await self._refresh_specialization_cache(specialization, location)
-            except Exception as e:
-                print(f"[CACHE REFRESH] Error refreshing {specialization}: {str(e)}")
-                continue
+        # Dispatch all specializations concurrently - the refreshes are
+        # independent and I/O-bound (Apify HTTP + Supabase writes), so
+        # wall-clock time drops from sum(latencies) to max(latency).
+        results = await asyncio.gather(
+            *[
+                self._refresh_specialization_cache(specialization, location)
+                for specialization in popular_specializations
+            ],
+            return_exceptions=True,
+        )
+
+        for specialization, result in zip(popular_specializations, results):
+            if isinstance(result, Exception):
+                print(f"[CACHE REFRESH] Error refreshing {specialization}: {str(result)}")
 
         print("[CACHE REFRESH] Completed cache refresh")
 
@@ -157,28 +181,63 @@ class BackgroundJobService:
         deduplicated_workers = deduplicate_workers(raw_workers)
         print(f"[CACHE REFRESH] Deduplicated to {len(deduplicated_workers)} workers")
 
-        # Step 3: Calculate trust scores
-        workers_with_trust = []
+        # Steps 3-5 fused: score each worker, accumulate an insert chunk,
+        # and flush (bulk insert + timestamp update) as chunks fill, so
+        # the list is traversed once with no intermediate materialization
+        scored_at = datetime.now(timezone.utc).isoformat()
+        chunk: list[dict[str, Any]] = []
+        timestamp_tasks: list[asyncio.Task] = []
+        saved_count = 0
+
         for worker in deduplicated_workers:
-            trust_result = calculate_trust_score(worker)
+            # CPU-bound scoring runs off the event loop
+            trust_result = await asyncio.to_thread(calculate_trust_score, worker)
             worker.update({
                 "trust_score": trust_result.score,
                 "trust_level": trust_result.level.value,
                 "trust_breakdown": trust_result.breakdown,
-                "last_score_calculated_at": datetime.now(timezone.utc).isoformat(),
+                "last_score_calculated_at": scored_at,
             })
-            workers_with_trust.append(worker)
+            chunk.append(worker)
 
-        # Step 4: Bulk insert (upsert by gmaps_place_id)
-        saved_workers = await bulk_insert_workers(workers_with_trust)
-        print(f"[CACHE REFRESH] Saved {len(saved_workers)} workers")
+            if len(chunk) >= INSERT_CHUNK_SIZE:
+                saved_count += await self._flush_worker_chunk(chunk, timestamp_tasks)
+                chunk = []
+
+        if chunk:
+            saved_count += await self._flush_worker_chunk(chunk, timestamp_tasks)
+
+        # Wait for all pipelined timestamp updates to land
+        if timestamp_tasks:
+            await asyncio.gather(*timestamp_tasks)
+
+        print(f"[CACHE REFRESH] Saved {saved_count} workers")
+        print(f"[CACHE REFRESH] Completed {specialization}")
+
+    async def _flush_worker_chunk(
+        self,
+        chunk: list[dict[str, Any]],
+        timestamp_tasks: list[asyncio.Task],
+    ) -> int:
+        """
+        Bulk insert one chunk of scored workers and stamp their scrape time.
+
+        The timestamp update is dispatched as a task rather than awaited,
+        so it overlaps with scoring and inserting the next chunk; the
+        caller gathers all pending tasks at the end of the pass.
+
+        Returns:
+            int: Number of workers saved
+        """
+        saved_workers = await bulk_insert_workers(chunk)
 
-        # Step 5: Update scraped timestamps
         worker_ids = [w["id"] for w in saved_workers if "id" in w]
         if worker_ids:
-            await update_worker_scraped_timestamp(worker_ids)
+            timestamp_tasks.append(
+                asyncio.create_task(update_worker_scraped_timestamp(worker_ids))
+            )
 
-        print(f"[CACHE REFRESH] Completed {specialization}")
+        return len(saved_workers)
 
     async def recalculate_stale_trust_scores(self):
         """
@@ -200,45 +259,93 @@ class BackgroundJobService:
 
         supabase = get_supabase_client()
 
-        # Fetch workers with stale trust scores
-        response = (
-            supabase.table("workers")
-            .select("*")
-            .eq("is_active", True)
-            .or_(
-                f"last_score_calculated_at.is.null,"
-                f"last_score_calculated_at.lt.{cutoff_date.isoformat()}"
+        # Keyset-page through stale workers so memory stays bounded and
+        # each PostgREST payload fits well under response limits. Paging
+        # by id (not offset) matters here: each processed page gets a
+        # fresh last_score_calculated_at and drops out of the staleness
+        # filter, so an advancing offset would skip past an equal number
+        # of still-stale rows.
+        last_id = None
+        total_updated = 0
+        while True:
+            query = (
+                supabase.table("workers")
+                .select("*")
+                .eq("is_active", True)
+                .or_(
+                    f"last_score_calculated_at.is.null,"
+                    f"last_score_calculated_at.lt.{cutoff_date.isoformat()}"
+                )
+                .order("id")
+                .limit(STALE_WORKER_PAGE_SIZE)
             )
-            .limit(1000)  # Process max 1000 workers per run
-            .execute()
-        )
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            # Synchronous supabase client - run the round-trip off the
+            # event loop like the integration helpers do
+            response = await asyncio.to_thread(query.execute)
 
-        workers = response.data if response.data else []
+            workers = response.data if response.data else []
 
-        if not workers:
-            print("[TRUST RECALC] No stale workers found")
-            return
+            if not workers:
+                if last_id is None:
+                    print("[TRUST RECALC] No stale workers found")
+                break
+
+            print(f"[TRUST RECALC] Recalculating scores for {len(workers)} workers")
+            total_updated += await self._recalculate_worker_page(workers)
+
+            if len(workers) < STALE_WORKER_PAGE_SIZE:
+                break
+            last_id = workers[-1]["id"]
+
+        print(f"[TRUST RECALC] Completed recalculation for {total_updated} workers")
 
-        print(f"[TRUST RECALC] Recalculating scores for {len(workers)} workers")
+    async def _recalculate_worker_page(self, workers: list[dict[str, Any]]) -> int:
+        """
+        Recalculate trust scores for one page of workers and bulk-write.
+
+        Scores are recalculated concurrently (bounded so any I/O-backed
+        trust signals don't overwhelm downstream APIs), then written back
+        in a single set-oriented UPDATE via bulk_update_worker_trust,
+        which also stamps last_score_calculated_at server-side.
+
+        Returns:
+            int: Number of workers successfully updated
+        """
+        semaphore = asyncio.Semaphore(settings.trust_recalc_concurrency)
 
-        # Recalculate trust scores
-        for worker in workers:
-            try:
-                trust_result = calculate_trust_score(worker)
+        async def _recalculate(worker: dict[str, Any]):
+            async with semaphore:
+                # CPU-bound scoring runs off the event loop so the
+                # scheduler never blocks long enough to misfire other jobs
+                return await asyncio.to_thread(calculate_trust_score, worker)
 
-                # Update worker trust score
-                supabase.table("workers").update({
-                    "trust_score": trust_result.score,
-                    "trust_level": trust_result.level.value,
-                    "trust_breakdown": trust_result.breakdown,
-                    "last_score_calculated_at": datetime.now(timezone.utc).isoformat(),
-                }).eq("id", worker["id"]).execute()
+        results = await asyncio.gather(
+            *[_recalculate(worker) for worker in workers],
+            return_exceptions=True,
+        )
 
-            except Exception as e:
-                print(f"[TRUST RECALC] Error recalculating worker {worker['id']}: {str(e)}")
+        updates = []
+        for worker, trust_result in zip(workers, results):
+            if isinstance(trust_result, Exception):
+                print(f"[TRUST RECALC] Error recalculating worker {worker['id']}: {str(trust_result)}")
                 continue
+            updates.append({
+                "id": worker["id"],
+                "trust_score": trust_result.score,
+                "trust_level": trust_result.level.value,
+                "trust_breakdown": trust_result.breakdown,
+            })
 
-        print(f"[TRUST RECALC] Completed recalculation for {len(workers)} workers")
+        # Single set-oriented UPDATE instead of one round-trip per worker.
+        # An upsert can't carry these partial rows: workers has NOT NULL
+        # columns (business_name, source_tier) that the candidate insert
+        # tuple would violate before ON CONFLICT ever arbitrates.
+        if updates:
+            await bulk_update_worker_trust(updates)
+
+        return len(updates)
 
     async def cleanup_old_scrape_jobs(self):
         """
@@ -290,21 +397,18 @@ class BackgroundJobService:
         await self._refresh_specialization_cache(specialization, location)
 
 
-# Global scheduler instance
-_scheduler_instance: BackgroundJobService | None = None
-
-
+@lru_cache
 def get_scheduler() -> BackgroundJobService:
     """
     Get singleton scheduler instance.
 
+    Cached at first call - same idiom as get_settings and
+    get_supabase_client, with no per-call None check.
+
     Returns:
         BackgroundJobService: Global scheduler instance
     """
-    global _scheduler_instance
-    if _scheduler_instance is None:
-        _scheduler_instance = BackgroundJobService()
-    return _scheduler_instance
+    return BackgroundJobService()
 
 
 def start_background_jobs():
@@ -160,7 +160,9 @@ def calculate_verification_score(
 
 
 def calculate_freshness_score(
-    last_active: datetime | None, listing_age_days: int | None
+    last_active: datetime | None,
+    listing_age_days: int | None,
+    now: datetime | None = None,
 ) -> int:
     """
     Calculate score from listing freshness.
@@ -174,13 +176,14 @@ def calculate_freshness_score(
     Args:
         last_active: Last activity timestamp
         listing_age_days: Days since listing created (for OLX)
+        now: Reference time (defaults to utcnow; batch callers hoist it)
 
     Returns:
         int: Freshness score (0-10 points)
     """
     # Use last_active if available, otherwise use listing age
     if last_active:
-        age_days = (datetime.utcnow() - last_active).days
+        age_days = ((now or datetime.utcnow()) - last_active).days
     elif listing_age_days is not None:
         age_days = listing_age_days
     else:
@@ -348,6 +351,84 @@ def mask_phone_number(phone: str) -> str:
     return f"{clean[:4]}████{clean[-4:]}"
 
 
+# Source scores keyed by raw tier value, for batch scoring without
+# per-row enum construction
+_SOURCE_SCORES_BY_VALUE = {tier.value: score for tier, score in SOURCE_SCORES.items()}
+
+
+def calculate_trust_scores_batch(workers: list[dict]) -> list[TrustScoreDetailed]:
+    """
+    Calculate trust scores for a batch of worker database records.
+
+    Batched counterpart to create_trust_score_from_worker_dict for the
+    scraper and background-job paths that score hundreds of workers at a
+    time: the freshness reference time is computed once per batch and the
+    source tier resolves through a flat value lookup instead of per-row
+    enum construction.
+
+    Args:
+        workers: Worker dictionaries from database
+
+    Returns:
+        list[TrustScoreDetailed]: Trust scores in input order
+    """
+    now = datetime.utcnow()
+    results = []
+
+    for worker_data in workers:
+        source_str = worker_data.get("source_tier", "platform")
+        source_score = _SOURCE_SCORES_BY_VALUE.get(source_str)
+        if source_score is None:
+            source_str = SourceTier.PLATFORM.value
+            source_score = SOURCE_SCORES[SourceTier.PLATFORM]
+
+        review_count = worker_data.get("gmaps_review_count") or worker_data.get(
+            "platform_reviews", 0
+        )
+        rating = worker_data.get("gmaps_rating") or worker_data.get("platform_rating")
+
+        reviews_score = calculate_review_score(review_count)
+        rating_score = calculate_rating_score(rating)
+        verification_score = calculate_verification_score(
+            worker_data.get("gmaps_photos_count", 0),
+            bool(worker_data.get("website")),
+            bool(worker_data.get("whatsapp")),
+            worker_data.get("platform_jobs_completed", 0),
+        )
+        freshness_score = calculate_freshness_score(
+            worker_data.get("last_scraped_at"),
+            worker_data.get("olx_listing_age_days"),
+            now=now,
+        )
+
+        total_score = (
+            source_score
+            + reviews_score
+            + rating_score
+            + verification_score
+            + freshness_score
+        )
+
+        results.append(
+            TrustScoreDetailed(
+                total_score=total_score,
+                trust_level=determine_trust_level(total_score),
+                breakdown={
+                    "source": source_score,
+                    "reviews": reviews_score,
+                    "rating": rating_score,
+                    "verification": verification_score,
+                    "freshness": freshness_score,
+                },
+                source_tier=SourceTier(source_str),
+                review_count=review_count,
+                rating=rating,
+            )
+        )
+
+    return results
+
+
 # Backward compatibility helper for old worker data format
 def create_trust_score_from_worker_dict(worker_data: dict) -> TrustScoreDetailed:
     """
@@ -9,9 +9,13 @@ Handles:
 """
 
 import re
-from difflib import SequenceMatcher
+import sys
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
+from rapidfuzz import fuzz, process
+
 from app.services.trust_calculator import SourceTier
 
 
@@ -23,6 +27,28 @@ PHONE_PATTERNS = {
     "landline": re.compile(r"^(?:\+62|62|0)(?:2[1-9]|3[1-9]|4[1-9]|5[1-9]|6[1-9])[0-9]{6,8}$"),
 }
 
+# Validators as a flat tuple - skips the dict-view iteration per call
+_PHONE_VALIDATORS = tuple(PHONE_PATTERNS.values())
+
+# Deletion table for phone separators - one C-level pass, no regex engine
+_PHONE_TRANS = str.maketrans("", "", " \t\n-().")
+
+# Business entity types (Indonesian and English), matched per token in one
+# pass - adding entries stays O(1) per token instead of growing an alternation
+_ENTITY_TOKENS = frozenset(("pt", "cv", "ud", "toko", "jasa", "llc", "inc", "ltd"))
+
+# Normalization patterns, compiled once - these run inside the dedup inner loop
+_POSSESSIVE_RE = re.compile(r"'s\b")
+
+# Default source priority for profile merging (higher = better)
+_DEFAULT_SOURCE_PRIORITY = {
+    SourceTier.PLATFORM.value: 4,
+    SourceTier.MANUAL_CURATED.value: 3,
+    SourceTier.GOOGLE_MAPS.value: 2,
+    SourceTier.OLX.value: 1,
+}
+_NONALNUM_RE = re.compile(r"[^a-z0-9\s]")
+
 
 def normalize_phone_number(phone: str | None) -> str | None:
     """
@@ -55,8 +81,14 @@ def normalize_phone_number(phone: str | None) -> str | None:
     if not phone:
         return None
 
-    # Remove all non-digit characters except leading +
-    cleaned = re.sub(r"[^\d+]", "", phone)
+    return _normalize_phone_cached(phone)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_phone_cached(phone: str) -> str | None:
+    """Cached normalization core; empty input is filtered out by the caller."""
+    # Strip separator characters; validation below rejects anything else
+    cleaned = phone.translate(_PHONE_TRANS)
 
     # Remove leading + temporarily for processing
     if cleaned.startswith("+"):
@@ -77,17 +109,23 @@ def normalize_phone_number(phone: str | None) -> str | None:
         return None
 
     # Validate against known patterns
-    for pattern in PHONE_PATTERNS.values():
+    for pattern in _PHONE_VALIDATORS:
         if pattern.match(normalized):
-            return normalized
+            # Interned: normalized phones are dict keys in the blocking index,
+            # so identical numbers share one object and compare by pointer
+            return sys.intern(normalized)
 
     return None
 
 
+@lru_cache(maxsize=4096)
 def normalize_business_name(name: str) -> str:
     """
     Normalize business name for comparison.
 
+    Memoized: pairwise duplicate checks normalize the same raw names
+    O(N) times each, so each unique name pays the regex cost once.
+
     Removes:
     - Common business suffixes (PT, CV, UD, Toko, Jasa)
     - Extra whitespace
@@ -109,37 +147,34 @@ def normalize_business_name(name: str) -> str:
     # Convert to lowercase
     normalized = name.lower()
 
-    # Remove business entity types (Indonesian and English)
-    entity_types = [
-        r"\bpt\.?\b",  # Perseroan Terbatas
-        r"\bcv\.?\b",  # Commanditaire Vennootschap
-        r"\bud\.?\b",  # Usaha Dagang
-        r"\btoko\b",  # Shop
-        r"\bjasa\b",  # Service
-        r"\bllc\.?\b",  # Limited Liability Company
-        r"\binc\.?\b",  # Incorporated
-        r"\bltd\.?\b",  # Limited
-    ]
-    for entity in entity_types:
-        normalized = re.sub(entity, "", normalized)
+    # Remove business entity types (PT, CV, UD, Toko, Jasa, LLC, Inc, Ltd)
+    # in a single tokenizing pass with set lookups
+    kept = []
+    for token in normalized.split():
+        if token.rstrip(".") in _ENTITY_TOKENS:
+            continue
+        # Entity glued to the name with a dot, e.g. "pt.bali"
+        head, dot, rest = token.partition(".")
+        if dot and head in _ENTITY_TOKENS:
+            token = rest
+        kept.append(token)
+    normalized = " ".join(kept)
 
     # Remove possessive forms
-    normalized = re.sub(r"'s\b", "", normalized)
+    normalized = _POSSESSIVE_RE.sub("", normalized)
 
     # Remove special characters, keep only alphanumeric and spaces
-    normalized = re.sub(r"[^a-z0-9\s]", "", normalized)
-
-    # Remove extra whitespace
-    normalized = " ".join(normalized.split())
+    normalized = _NONALNUM_RE.sub("", normalized)
 
-    return normalized.strip()
+    # Remove extra whitespace; interned so repeated names share one object
+    return sys.intern(" ".join(normalized.split()))
 
 
 def calculate_name_similarity(name1: str, name2: str) -> float:
     """
     Calculate similarity score between two business names.
 
-    Uses SequenceMatcher with normalized names for fuzzy matching.
+    Uses RapidFuzz ratio with normalized names for fuzzy matching.
     Handles common variations like typos, abbreviations, word order.
 
     Args:
@@ -162,8 +197,55 @@ def calculate_name_similarity(name1: str, name2: str) -> float:
     if norm1 == norm2:
         return 1.0
 
-    # Sequence matching for fuzzy comparison
-    return SequenceMatcher(None, norm1, norm2).ratio()
+    # Order the pair so symmetric comparisons share a cache entry
+    if norm1 > norm2:
+        norm1, norm2 = norm2, norm1
+
+    return _cached_name_ratio(norm1, norm2)
+
+
+@lru_cache(maxsize=4096)
+def _trigrams(name: str) -> frozenset[str]:
+    """Character 3-gram set for the Jaccard pre-filter."""
+    return frozenset(name[i:i + 3] for i in range(len(name) - 2))
+
+
+@lru_cache(maxsize=4096)
+def _cached_name_ratio(norm1: str, norm2: str) -> float:
+    """Name similarity on normalized, pair-ordered names.
+
+    A trigram Jaccard pass settles clear matches and clear mismatches in
+    O(n); only the ambiguous middle band pays for the edit-distance DP.
+    """
+    grams1 = _trigrams(norm1)
+    grams2 = _trigrams(norm2)
+
+    if grams1 and grams2:
+        jaccard = len(grams1 & grams2) / len(grams1 | grams2)
+        if jaccard > 0.85:
+            return 1.0
+        if jaccard < 0.3:
+            return 0.0
+
+    return fuzz.ratio(norm1, norm2) / 100.0
+
+
+class _WorkerView:
+    """Precomputed hot fields for one worker profile.
+
+    The pairwise loop reads phone, name, place_id, and location many times
+    per worker; slot attribute loads avoid repeated dict probes and
+    re-normalization.
+    """
+
+    __slots__ = ("raw", "phone", "name", "place_id", "loc")
+
+    def __init__(self, raw: dict[str, Any]) -> None:
+        self.raw = raw
+        self.phone = normalize_phone_number(raw.get("phone"))
+        self.name = normalize_business_name(raw.get("business_name", ""))
+        self.place_id = raw.get("gmaps_place_id")
+        self.loc = (raw.get("location") or "").lower()
 
 
 def are_workers_duplicates(
@@ -196,10 +278,24 @@ def are_workers_duplicates(
         ... )
         True
     """
-    # Check 1: Phone number exact match (highest confidence)
-    phone1 = normalize_phone_number(worker1.get("phone"))
-    phone2 = normalize_phone_number(worker2.get("phone"))
+    return _are_views_duplicates(
+        _WorkerView(worker1),
+        _WorkerView(worker2),
+        name_threshold,
+        phone_match_required,
+    )
+
 
+def _are_views_duplicates(
+    view1: _WorkerView,
+    view2: _WorkerView,
+    name_threshold: float,
+    phone_match_required: bool,
+) -> bool:
+    """Duplicate check on precomputed views; deduplicate_workers builds one
+    view per worker and feeds them straight in here."""
+    # Check 1: Phone number exact match (highest confidence)
+    phone1, phone2 = view1.phone, view2.phone
     if phone1 and phone2 and phone1 == phone2:
         return True
 
@@ -208,22 +304,26 @@ def are_workers_duplicates(
         return False
 
     # Check 2: Google Maps place_id match (if available)
-    place_id1 = worker1.get("gmaps_place_id")
-    place_id2 = worker2.get("gmaps_place_id")
-
-    if place_id1 and place_id2 and place_id1 == place_id2:
+    if view1.place_id and view2.place_id and view1.place_id == view2.place_id:
         return True
 
     # Check 3: High name similarity + location match
-    name_similarity = calculate_name_similarity(
-        worker1.get("business_name", ""),
-        worker2.get("business_name", ""),
-    )
+    norm1, norm2 = view1.name, view2.name
+    if norm1 == norm2:
+        name_similarity = 1.0
+    else:
+        # Length filter: the indel ratio is capped at 2*min/(len1+len2),
+        # so skip the edit-distance DP when lengths alone rule out a match
+        if 2 * min(len(norm1), len(norm2)) / (len(norm1) + len(norm2)) < name_threshold:
+            return False
+
+        if norm1 > norm2:
+            norm1, norm2 = norm2, norm1
+        name_similarity = _cached_name_ratio(norm1, norm2)
 
     if name_similarity >= name_threshold:
         # Check if locations match (approximately)
-        loc1 = worker1.get("location", "").lower()
-        loc2 = worker2.get("location", "").lower()
+        loc1, loc2 = view1.loc, view2.loc
 
         # Simple location matching (same city/area)
         if loc1 and loc2:
@@ -273,12 +373,7 @@ def merge_worker_profiles(
 
     # Default source priority
     if source_priority is None:
-        source_priority = {
-            SourceTier.PLATFORM.value: 4,
-            SourceTier.MANUAL_CURATED.value: 3,
-            SourceTier.GOOGLE_MAPS.value: 2,
-            SourceTier.OLX.value: 1,
-        }
+        source_priority = _DEFAULT_SOURCE_PRIORITY
 
     # Sort workers by source priority (highest first)
     sorted_workers = sorted(
@@ -287,37 +382,25 @@ def merge_worker_profiles(
         reverse=True,
     )
 
-    # Start with highest priority worker as base
-    merged = sorted_workers[0].copy()
-
-    # Aggregate data from all sources
-    all_specializations = set()
-    all_categories = set()
-    max_rating = 0.0
-    total_reviews = 0
-
-    for worker in sorted_workers:
-        # Aggregate specializations
-        if worker.get("specializations"):
-            all_specializations.update(worker["specializations"])
-
-        # Aggregate categories
-        if worker.get("gmaps_categories"):
-            all_categories.update(worker["gmaps_categories"])
-
-        # Take maximum rating
-        rating = worker.get("gmaps_rating") or worker.get("olx_rating") or 0.0
-        if rating > max_rating:
-            max_rating = rating
-
-        # Sum review counts
-        total_reviews += worker.get("gmaps_review_count", 0)
-        total_reviews += worker.get("olx_review_count", 0)
-
-        # Fill in missing fields from lower priority sources
-        for key, value in worker.items():
-            if key not in merged or merged[key] is None:
-                merged[key] = value
+    # Single reduce pass, lowest priority first: higher sources overwrite
+    # with their non-None values, so "higher wins, lower fills the gaps"
+    merged: dict[str, Any] = {}
+    for worker in reversed(sorted_workers):
+        merged.update(
+            (key, value)
+            for key, value in worker.items()
+            if value is not None or key not in merged
+        )
+
+    # Aggregate across all sources; dict.fromkeys dedupes while keeping
+    # source-priority order, without a throwaway hash-set per merge
+    all_specializations = dict.fromkeys(chain.from_iterable(w.get("specializations") or () for w in sorted_workers))
+    all_categories = dict.fromkeys(chain.from_iterable(w.get("gmaps_categories") or () for w in sorted_workers))
+    max_rating = max((w.get("gmaps_rating") or w.get("olx_rating") or 0.0) for w in sorted_workers)
+    total_reviews = sum(
+        w.get("gmaps_review_count", 0) + w.get("olx_review_count", 0)
+        for w in sorted_workers
+    )
 
     # Update aggregated fields
     merged["specializations"] = list(all_specializations)
@@ -337,6 +420,39 @@ def merge_worker_profiles(
     return merged
 
 
+class _UnionFind:
+    """Disjoint-set over worker indices with path compression and
+    union by rank, so grouping stays near-linear on large inputs."""
+
+    def __init__(self, size: int) -> None:
+        self._parent = list(range(size))
+        self._rank = [0] * size
+
+    def find(self, i: int) -> int:
+        parent = self._parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        # Compress the path for subsequent lookups
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def union(self, i: int, j: int) -> None:
+        root_i = self.find(i)
+        root_j = self.find(j)
+        if root_i == root_j:
+            return
+
+        rank = self._rank
+        # Attach the shallower tree under the deeper one
+        if rank[root_i] < rank[root_j]:
+            root_i, root_j = root_j, root_i
+        self._parent[root_j] = root_i
+        if rank[root_i] == rank[root_j]:
+            rank[root_i] += 1
+
+
 def deduplicate_workers(
     workers: list[dict[str, Any]],
     name_threshold: float = 0.85,
@@ -345,9 +461,10 @@ def deduplicate_workers(
     Deduplicate a list of worker profiles.
 
     Process:
-    1. Group workers by normalized phone number
-    2. Within each group, find similar names
-    3. Merge duplicate profiles
+    1. Index workers by normalized phone and gmaps_place_id so exact
+       duplicates are found with hash probes instead of all-pairs scans
+    2. Bucket the rest by location and fuzzy-match names within buckets
+    3. Merge each duplicate group
     4. Return deduplicated list
 
     Args:
@@ -369,39 +486,74 @@ def deduplicate_workers(
     if not workers:
         return []
 
-    # Track processed workers and duplicates
-    processed = set()
-    duplicate_groups = []
-
-    # Find duplicate groups
-    for i, worker1 in enumerate(workers):
-        if i in processed:
+    groups = _UnionFind(len(workers))
+
+    # Pass 1: normalize every worker once, then build the blocking indexes
+    views = [_WorkerView(w) for w in workers]
+    phone_index: dict[str, int] = {}
+    placeid_buckets: dict[str, list[int]] = {}
+    loc_buckets: dict[str, list[int]] = {}
+
+    for i, view in enumerate(views):
+        phone = view.phone
+        if phone:
+            if phone in phone_index:
+                groups.union(phone_index[phone], i)
+            else:
+                phone_index[phone] = i
+
+        if view.place_id:
+            placeid_buckets.setdefault(view.place_id, []).append(i)
+
+        if view.loc:
+            # Index under every location token so compound locations
+            # ("North Canggu", "Canggu, Bali") share a bucket with the
+            # plain area names the containment check would match
+            for token in dict.fromkeys(
+                t.rstrip(",") for t in view.loc.split()
+            ):
+                if token:
+                    loc_buckets.setdefault(sys.intern(token), []).append(i)
+
+    # Same place_id is a duplicate unless both phones are present and differ
+    for bucket in placeid_buckets.values():
+        for pos, i in enumerate(bucket):
+            for j in bucket[pos + 1:]:
+                if not (views[i].phone and views[j].phone and views[i].phone != views[j].phone):
+                    groups.union(i, j)
+
+    # Pass 2: fuzzy name matching, restricted to the same location bucket.
+    # cdist scores the whole bucket in one C call (multithreaded, GIL
+    # released); only pairs at the threshold reach the Python-level checks.
+    cutoff = name_threshold * 100
+    for bucket in loc_buckets.values():
+        if len(bucket) < 2:
             continue
 
-        # Start new group with this worker
-        group = [worker1]
-        processed.add(i)
-
-        # Find all duplicates for this worker
-        for j, worker2 in enumerate(workers):
-            if j <= i or j in processed:
-                continue
+        bucket_names = [views[i].name for i in bucket]
+        scores = process.cdist(bucket_names, bucket_names, scorer=fuzz.ratio, score_cutoff=cutoff, workers=-1)
 
-            if are_workers_duplicates(worker1, worker2, name_threshold):
-                group.append(worker2)
-                processed.add(j)
+        for pos, i in enumerate(bucket):
+            for offset, j in enumerate(bucket[pos + 1:], start=pos + 1):
+                if scores[pos][offset] < cutoff:
+                    continue
+                if groups.find(i) == groups.find(j):
+                    continue
+                if _are_views_duplicates(views[i], views[j], name_threshold, phone_match_required=True):
+                    groups.union(i, j)
 
-        duplicate_groups.append(group)
+    # Collect groups in first-seen order and merge
+    grouped: dict[int, list[dict[str, Any]]] = {}
+    for i, worker in enumerate(workers):
+        grouped.setdefault(groups.find(i), []).append(worker)
 
-    # Merge each duplicate group
     deduplicated = []
-    for group in duplicate_groups:
+    for group in grouped.values():
         if len(group) == 1:
             # No duplicates, keep as is
             deduplicated.append(group[0])
         else:
             # Merge duplicates
-            merged = merge_worker_profiles(group)
-            deduplicated.append(merged)
+            deduplicated.append(merge_worker_profiles(group))
 
     return deduplicated
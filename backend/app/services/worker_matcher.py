@@ -9,9 +9,13 @@ Handles:
 - Multi-criteria ranking with weighted scores
 """
 
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
-from app.services.trust_calculator import TrustLevel
+import numpy as np
+
+from app.schemas.worker import TrustLevel
 
 
 # Map user-facing project types to worker specializations
@@ -45,6 +49,36 @@ PROJECT_TYPE_TO_SPECIALIZATION = {
     "construction": "general",
 }
 
+# Trust level hierarchy as integer ranks, built once so filtering is a
+# single dict-get plus int compare per worker. Workers carry trust_level
+# as a plain string; TrustLevel is a str Enum, so a string-keyed mirror
+# serves both without per-call enum resolution.
+_TRUST_RANK = {
+    TrustLevel.LOW: 1,
+    TrustLevel.MEDIUM: 2,
+    TrustLevel.HIGH: 3,
+    TrustLevel.VERIFIED: 4,
+}
+_STR_TO_TRUST_RANK = {level.value: rank for level, rank in _TRUST_RANK.items()}
+
+# One bit per known specialization, derived from the mapping values above.
+# Encoding a worker's specialization list as an int turns the match check
+# into two bitwise ANDs, and the same masks vectorize over a uint32 array.
+_SPEC_BIT = {
+    spec: 1 << i
+    for i, spec in enumerate(dict.fromkeys(PROJECT_TYPE_TO_SPECIALIZATION.values()))
+}
+_GENERAL_BIT = _SPEC_BIT["general"]
+
+
+def _encode_specs(specs: list[str] | None) -> int:
+    """Fold a specialization list into its bitmask; unknown specs drop out."""
+    mask = 0
+    for spec in specs or ():
+        mask |= _SPEC_BIT.get(spec, 0)
+    return mask
+
+
 # Bali area hierarchy for location matching
 BALI_AREA_GROUPS = {
     "south": ["canggu", "seminyak", "kuta", "legian", "jimbaran", "uluwatu", "pecatu"],
@@ -53,6 +87,13 @@ BALI_AREA_GROUPS = {
     "north": ["lovina", "singaraja"],
 }
 
+# Flat area -> group lookup table, built once at import. A single dict
+# lookup per location token replaces the nested substring scan over all
+# BALI_AREA_GROUPS entries on every call.
+_AREA_TO_GROUP = {
+    area: group for group, areas in BALI_AREA_GROUPS.items() for area in areas
+}
+
 # Budget range definitions (IDR)
 BUDGET_RANGES = {
     "low": (0, 50_000_000),  # Under 50M IDR
@@ -60,7 +101,61 @@ BUDGET_RANGES = {
     "high": (150_000_000, float("inf")),  # Over 150M IDR
 }
 
+# Branchless budget scoring: a price falls into one of three buckets
+# (below 50M / 50-150M / 150M+) computed from two comparisons, and the
+# score is a table lookup on (budget code, bucket) - 1.0 on the diagonal
+# where the bucket matches the requested range, 0.3 everywhere else.
+# The same two comparisons vectorize directly over a price array.
+_BUDGET_CODE = {"low": 0, "medium": 1, "high": 2}
+_BUDGET_EDGE_LO, _BUDGET_EDGE_HI = (float(b) for b in BUDGET_RANGES["medium"])
+_SCORE_TABLE = np.array(
+    [
+        [1.0, 0.3, 0.3],
+        [0.3, 1.0, 0.3],
+        [0.3, 0.3, 1.0],
+    ]
+)
+
+# float32 mirrors for the batched path. Components all live in [0, 1] and
+# weights are small constants, so single precision is plenty there; the
+# scalar functions keep float64 so their returns stay exact Python floats
+# (callers compare against literals like 0.3).
+_SCORE_TABLE_F32 = _SCORE_TABLE.astype(np.float32)
+_SPEC_LUT = np.array([0.0, 0.7, 1.0], dtype=np.float32)
+
+
+@dataclass(slots=True)
+class WorkerProfile:
+    """
+    Slotted view of a worker dict for the ranking hot path.
+
+    Attribute access on a slotted dataclass is a C-level slot lookup,
+    which is cheaper than the repeated `dict.get(key, default)` calls
+    the scoring loop would otherwise make per worker. Workers follow a
+    known schema, so dicts are converted once per ranking pass.
+    """
+
+    trust_score: int = 0
+    location: str = ""
+    specializations: list[str] = field(default_factory=list)
+    daily_rate_idr: float | None = None
+    price_idr_per_day: float | None = None
+    olx_price_idr: float | None = None
+
+    @classmethod
+    def from_dict(cls, worker: dict[str, Any]) -> "WorkerProfile":
+        """Build a profile from a worker dict, ignoring unknown keys."""
+        return cls(
+            **{k: worker[k] for k in cls.__dataclass_fields__ if k in worker}
+        )
 
+    @property
+    def price(self) -> float | None:
+        """Worker price, trying the known price fields in priority order."""
+        return self.daily_rate_idr or self.price_idr_per_day or self.olx_price_idr
+
+
+@lru_cache(maxsize=256)
 def map_project_type_to_specialization(project_type: str) -> str:
     """
     Convert user's project_type to worker specialization for scraping/matching.
@@ -79,9 +174,33 @@ def map_project_type_to_specialization(project_type: str) -> str:
         >>> map_project_type_to_specialization("unknown_type")
         'general'
     """
+    # API callers already send lowercase types, so try the raw key first
+    # and only pay for the .lower() copy on mixed-case input
+    hit = PROJECT_TYPE_TO_SPECIALIZATION.get(project_type)
+    if hit is not None:
+        return hit
     return PROJECT_TYPE_TO_SPECIALIZATION.get(project_type.lower(), "general")
 
 
+def _find_area_group(location: str) -> str | None:
+    """
+    Resolve a lowercased location string to its Bali area group.
+
+    Fast path: O(1) dict lookups on whitespace-separated tokens. Falls
+    back to a full substring scan only when no token matches, to handle
+    compound inputs like "north-canggu".
+    """
+    group = next(
+        (_AREA_TO_GROUP[t] for t in location.split() if t in _AREA_TO_GROUP), None
+    )
+    if group is not None:
+        return group
+
+    return next(
+        (g for a, g in _AREA_TO_GROUP.items() if a in location), None
+    )
+
+
 def calculate_location_relevance(
     worker_location: str, requested_location: str
 ) -> float:
@@ -120,14 +239,8 @@ def calculate_location_relevance(
         return 1.0
 
     # Find area groups for both locations
-    worker_group = None
-    requested_group = None
-
-    for group_name, areas in BALI_AREA_GROUPS.items():
-        if any(area in worker_loc for area in areas):
-            worker_group = group_name
-        if any(area in requested_loc for area in areas):
-            requested_group = group_name
+    worker_group = _find_area_group(worker_loc)
+    requested_group = _find_area_group(requested_loc)
 
     # Same area group (South, Central, etc.)
     if worker_group and requested_group and worker_group == requested_group:
@@ -166,12 +279,19 @@ def calculate_specialization_match(
     if not worker_specializations:
         return 0.0
 
+    mask = _encode_specs(worker_specializations)
+    target_bit = _SPEC_BIT.get(required_specialization)
+
     # Exact match
-    if required_specialization in worker_specializations:
+    if target_bit is not None:
+        if mask & target_bit:
+            return 1.0
+    elif required_specialization in worker_specializations:
+        # Specialization outside the known table - direct membership check
         return 1.0
 
     # General contractor can do most things (lower confidence)
-    if "general" in worker_specializations:
+    if mask & _GENERAL_BIT:
         return 0.7
 
     # No relevant specialization
@@ -207,14 +327,16 @@ def calculate_budget_relevance(
     if not budget_range or not worker_price:
         return 0.5  # Neutral score for missing data
 
-    min_budget, max_budget = BUDGET_RANGES.get(budget_range, (0, float("inf")))
+    budget_code = _BUDGET_CODE.get(budget_range)
+    if budget_code is None:
+        return 0.5  # Unknown budget label - neutral, like missing data
 
-    # Worker price within budget range
-    if min_budget <= worker_price <= max_budget:
-        return 1.0
+    return float(_SCORE_TABLE[budget_code, _price_bucket(worker_price)])
 
-    # Worker price outside budget range
-    return 0.3
+
+def _price_bucket(price: float) -> int:
+    """Branchless bucket index: 0 below 50M, 1 for 50-150M, 2 for 150M+."""
+    return (price >= _BUDGET_EDGE_LO) + (price >= _BUDGET_EDGE_HI)
 
 
 def calculate_overall_rank_score(
@@ -265,25 +387,53 @@ def calculate_overall_rank_score(
         >>> calculate_overall_rank_score(worker, "pool", "Canggu", "low")
         92.5
     """
+    return _score_profile(
+        profile=WorkerProfile.from_dict(worker),
+        required_specialization=required_specialization,
+        requested_location=requested_location,
+        budget_code=_resolve_budget_code(budget_range),
+        trust_weight=trust_weight,
+        location_weight=location_weight,
+        specialization_weight=specialization_weight,
+        budget_weight=budget_weight,
+    )
+
+
+def _resolve_budget_code(budget_range: str | None) -> int | None:
+    """Resolve a budget range name to its score-table row, once per pass."""
+    if not budget_range:
+        return None
+    return _BUDGET_CODE.get(budget_range)
+
+
+def _score_profile(
+    profile: WorkerProfile,
+    required_specialization: str,
+    requested_location: str,
+    budget_code: int | None,
+    trust_weight: float = 0.5,
+    location_weight: float = 0.2,
+    specialization_weight: float = 0.2,
+    budget_weight: float = 0.1,
+) -> float:
+    """Scoring kernel operating on a slotted WorkerProfile (attribute access only)."""
     # Normalize trust score to 0-1 scale
-    trust_score = worker.get("trust_score", 0) / 100.0
+    trust_score = profile.trust_score / 100.0
 
     # Calculate component scores
     location_score = calculate_location_relevance(
-        worker.get("location", ""), requested_location
+        profile.location, requested_location
     )
 
     specialization_score = calculate_specialization_match(
-        worker.get("specializations", []), required_specialization
+        profile.specializations, required_specialization
     )
 
-    # Get worker price (try different fields)
-    worker_price = (
-        worker.get("daily_rate_idr")
-        or worker.get("price_idr_per_day")
-        or worker.get("olx_price_idr")
-    )
-    budget_score = calculate_budget_relevance(worker_price, budget_range)
+    price = profile.price
+    if budget_code is None or not price:
+        budget_score = 0.5  # Neutral score for missing data
+    else:
+        budget_score = float(_SCORE_TABLE[budget_code, _price_bucket(price)])
 
     # Calculate weighted score
     overall_score = (
@@ -297,6 +447,103 @@ def calculate_overall_rank_score(
     return overall_score * 100.0
 
 
+def _score_workers_vectorized(
+    workers: list[dict[str, Any]],
+    required_specialization: str,
+    requested_location: str,
+    budget_code: int | None,
+    trust_weight: float = 0.5,
+    location_weight: float = 0.2,
+    specialization_weight: float = 0.2,
+    budget_weight: float = 0.1,
+) -> np.ndarray:
+    """
+    Score a batch of workers as parallel NumPy arrays (SoA layout).
+
+    The location component depends on substring logic that cannot be
+    expressed as array ops, but real batches contain only a handful of
+    distinct locations - so each distinct value is scored once through
+    the scalar function and the result broadcast via a cache. Trust,
+    specialization (bitmask ANDs), budget (bucket table), and the fused
+    weighted sum are pure array arithmetic.
+    """
+    n = len(workers)
+
+    trust = np.fromiter(
+        (w.get("trust_score", 0) for w in workers), dtype=np.float32, count=n
+    )
+    trust /= 100.0
+
+    loc_cache: dict[str, float] = {}
+
+    def loc_relevance(value: str) -> float:
+        score = loc_cache.get(value)
+        if score is None:
+            score = loc_cache[value] = calculate_location_relevance(
+                value, requested_location
+            )
+        return score
+
+    loc_score = np.fromiter(
+        (loc_relevance(w.get("location", "")) for w in workers),
+        dtype=np.float32,
+        count=n,
+    )
+
+    # Specializations as bitmasks: two vectorized ANDs replace per-worker
+    # list membership. The target always comes from the project-type map,
+    # so it is guaranteed to have a bit.
+    target_bit = _SPEC_BIT[required_specialization]
+    masks = np.fromiter(
+        (_encode_specs(w.get("specializations")) for w in workers),
+        dtype=np.uint32,
+        count=n,
+    )
+    # uint8 codes into a tiny LUT: 2 = exact match, 1 = general only,
+    # 0 = no relevant specialization
+    spec_code = ((masks & target_bit) != 0).astype(np.uint8) * 2
+    np.maximum(
+        spec_code, ((masks & _GENERAL_BIT) != 0).astype(np.uint8), out=spec_code
+    )
+    spec_score = _SPEC_LUT[spec_code]
+
+    if budget_code is None:
+        budget_score = np.full(n, 0.5, dtype=np.float32)
+    else:
+        prices = np.fromiter(
+            (
+                w.get("daily_rate_idr")
+                or w.get("price_idr_per_day")
+                or w.get("olx_price_idr")
+                or np.nan
+                for w in workers
+            ),
+            dtype=np.float64,
+            count=n,
+        )
+        buckets = (prices >= _BUDGET_EDGE_LO).astype(np.intp) + (
+            prices >= _BUDGET_EDGE_HI
+        )
+        budget_score = _SCORE_TABLE_F32[budget_code, buckets]
+        budget_score[np.isnan(prices)] = 0.5  # Neutral for missing price
+
+    # Stack the components into an (N, 4) block and fold the weighted sum
+    # into a single matrix-vector product: one fused pass over the block
+    # instead of four scaled adds across separate temporaries.
+    components = np.empty((n, 4), dtype=np.float32)
+    components[:, 0] = trust
+    components[:, 1] = loc_score
+    components[:, 2] = spec_score
+    components[:, 3] = budget_score
+    weights = np.array(
+        [trust_weight, location_weight, specialization_weight, budget_weight],
+        dtype=np.float32,
+    )
+    scores = components @ weights
+    scores *= 100.0
+    return scores
+
+
 def rank_workers(
     workers: list[dict[str, Any]],
     project_type: str,
@@ -343,22 +590,33 @@ def rank_workers(
         w for w in workers if w.get("trust_score", 0) >= min_trust_score
     ]
 
-    # Calculate ranking scores
-    for worker in filtered_workers:
-        worker["ranking_score"] = calculate_overall_rank_score(
-            worker=worker,
-            required_specialization=required_specialization,
-            requested_location=location,
-            budget_range=budget_range,
-        )
+    if not filtered_workers:
+        return []
 
-    # Sort by ranking score (descending)
-    ranked_workers = sorted(
-        filtered_workers, key=lambda w: w["ranking_score"], reverse=True
-    )
+    # Resolve the budget score-table row once for the whole pass
+    budget_code = _resolve_budget_code(budget_range)
 
-    # Return top N results
-    return ranked_workers[:max_results]
+    # Score the whole batch as parallel arrays in one vectorized pass
+    scores = _score_workers_vectorized(
+        filtered_workers,
+        required_specialization=required_specialization,
+        requested_location=location,
+        budget_code=budget_code,
+    )
+    for worker, score in zip(filtered_workers, scores.tolist()):
+        worker["ranking_score"] = score
+
+    # Top-K selection: O(N + k log k) partition when only k of N rows are
+    # wanted, falling back to a full stable argsort when everything is
+    # returned anyway. lexsort on (index, -score) orders the selected
+    # slice descending by score with original order preserved on ties,
+    # matching what sorted(..., reverse=True) guaranteed.
+    if max_results < len(filtered_workers):
+        order = np.argpartition(-scores, max_results)[:max_results]
+        order = order[np.lexsort((order, -scores[order]))]
+    else:
+        order = np.argsort(-scores, kind="stable")
+    return [filtered_workers[i] for i in order]
 
 
 def filter_by_trust_level(
@@ -386,17 +644,10 @@ def filter_by_trust_level(
         >>> len(filtered)
         1
     """
-    trust_level_scores = {
-        TrustLevel.VERIFIED: 4,
-        TrustLevel.HIGH: 3,
-        TrustLevel.MEDIUM: 2,
-        TrustLevel.LOW: 1,
-    }
-
-    min_score = trust_level_scores.get(min_trust_level, 0)
+    min_rank = _TRUST_RANK.get(min_trust_level, 0)
 
     return [
         w
         for w in workers
-        if trust_level_scores.get(w.get("trust_level"), 0) >= min_score
+        if _STR_TO_TRUST_RANK.get(w.get("trust_level"), 0) >= min_rank
     ]
@@ -5,6 +5,7 @@ Appends affiliate tracking parameters to product URLs for revenue generation.
 The affiliate ID is loaded from the TOKOPEDIA_AFFILIATE_ID environment variable.
 """
 
+from functools import lru_cache
 from urllib.parse import parse_qs, quote, urlencode, urlparse, urlunparse
 
 from app.config import get_settings
@@ -63,11 +64,26 @@ def generate_affiliate_url(product_url: str | None) -> str | None:
         return product_url
 
     # Validate it's a Tokopedia URL with strict hostname check
-    parsed = urlparse(product_url)
-    if not _is_valid_tokopedia_hostname(parsed.hostname):
+    if not _is_valid_tokopedia_hostname(urlparse(product_url).hostname):
         # Not a valid Tokopedia URL - return as-is
         return product_url
 
+    return _build_affiliate_url(product_url, affiliate_id)
+
+
+@lru_cache(maxsize=8192)
+def _build_affiliate_url(product_url: str, affiliate_id: str) -> str:
+    """
+    Parse, encode and rebuild a validated Tokopedia URL with affiliate tracking.
+
+    Memoized on (product_url, affiliate_id): the same product URLs recur
+    across search results and pagination, so repeat calls become a single
+    cache lookup instead of re-parsing and re-encoding the URL. Invalid
+    and empty URLs are filtered out by the caller to keep them out of the
+    LRU.
+    """
+    parsed = urlparse(product_url)
+
     # Parse existing query parameters
     existing_params = parse_qs(parsed.query)
 
@@ -0,0 +1,30 @@
+-- Migration 006: Cached-workers RPC
+-- Collapses the worker cache check into a single server-side function call.
+-- Run this in Supabase SQL Editor
+--
+-- get_cached_workers() previously issued a SELECT with the freshness cutoff
+-- computed client-side; the cold path then triggered a scrape + insert, so
+-- every cache check cost a full round trip just to learn it missed. This
+-- function evaluates freshness server-side and returns both the verdict and
+-- the rows in one response.
+
+CREATE OR REPLACE FUNCTION get_cached_workers_or_nothing(
+    spec TEXT,
+    max_age_hours INT DEFAULT 168
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'fresh', COUNT(*) > 0,
+        'rows', COALESCE(jsonb_agg(to_jsonb(w) ORDER BY w.trust_score DESC), '[]'::jsonb)
+    )
+    FROM workers w
+    WHERE w.specializations @> ARRAY[spec]
+      AND w.is_active = TRUE
+      AND w.last_scraped_at >= now() - make_interval(hours => max_age_hours);
+$$;
+
+COMMENT ON FUNCTION get_cached_workers_or_nothing(TEXT, INT) IS
+    'Returns {"fresh": bool, "rows": [...]} for active workers with the given specialization scraped within max_age_hours. Uses idx_workers_specializations (GIN).';
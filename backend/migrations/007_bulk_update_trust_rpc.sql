@@ -0,0 +1,37 @@
+-- Migration 007: Bulk trust-score update RPC
+-- Collapses N per-worker trust updates into one set-oriented UPDATE.
+-- Run this in Supabase SQL Editor
+--
+-- Trust recalculation jobs update hundreds of workers per run; issuing a
+-- round trip per worker dominates job time. This function accepts the whole
+-- batch as JSONB and applies it in a single UPDATE ... FROM, stamping
+-- last_score_calculated_at server-side.
+
+CREATE OR REPLACE FUNCTION bulk_update_trust(payload JSONB)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+    WITH updates AS (
+        SELECT *
+        FROM jsonb_to_recordset(payload) AS u(
+            id UUID,
+            trust_score INTEGER,
+            trust_level VARCHAR(20),
+            trust_breakdown JSONB
+        )
+    ), updated AS (
+        UPDATE workers w
+        SET trust_score = u.trust_score,
+            trust_level = u.trust_level,
+            trust_breakdown = u.trust_breakdown,
+            last_score_calculated_at = now(),
+            updated_at = now()
+        FROM updates u
+        WHERE w.id = u.id
+        RETURNING w.id
+    )
+    SELECT COUNT(*)::INTEGER FROM updated;
+$$;
+
+COMMENT ON FUNCTION bulk_update_trust(JSONB) IS
+    'Applies a batch of {id, trust_score, trust_level, trust_breakdown} records in one UPDATE and returns the number of rows touched.';
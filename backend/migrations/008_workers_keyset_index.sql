@@ -0,0 +1,10 @@
+-- Migration 008: Composite index for keyset pagination
+-- Run this in Supabase SQL Editor
+--
+-- search_workers pages on (trust_score DESC, id); this index lets the
+-- keyset predicate seek directly instead of filter-then-sort over the
+-- whole table.
+
+CREATE INDEX IF NOT EXISTS idx_workers_trust_id
+    ON workers (trust_score DESC, id)
+    WHERE is_active = TRUE;
@@ -0,0 +1,33 @@
+-- Migration 009: Staging table for COPY bulk loads
+-- Run this in Supabase SQL Editor
+--
+-- Cold-start scrapes load tens of thousands of workers; COPY into an
+-- unlogged staging table followed by one set-oriented merge is several
+-- times faster than batched JSON upserts through PostgREST. Used by
+-- bulk_insert_workers(mode="copy"), which requires a direct Postgres
+-- DSN (supabase_direct_dsn).
+
+CREATE UNLOGGED TABLE IF NOT EXISTS workers_staging (
+    business_name VARCHAR(255) NOT NULL,
+    source_tier VARCHAR(50) NOT NULL,
+    phone VARCHAR(100),
+    whatsapp VARCHAR(100),
+    email VARCHAR(255),
+    website VARCHAR(500),
+    location VARCHAR(255),
+    address TEXT,
+    latitude DECIMAL(10, 8),
+    longitude DECIMAL(11, 8),
+    gmaps_place_id VARCHAR(255),
+    gmaps_rating DECIMAL(3, 2),
+    gmaps_review_count INTEGER,
+    gmaps_photos_count INTEGER,
+    gmaps_url TEXT,
+    gmaps_categories TEXT[],
+    specializations TEXT[],
+    last_scraped_at TIMESTAMPTZ,
+    is_active BOOLEAN
+);
+
+COMMENT ON TABLE workers_staging IS
+    'Transient landing zone for COPY bulk loads; merged into workers and truncated by bulk_insert_workers(mode="copy").';
@@ -0,0 +1,39 @@
+-- Migration 010: Worker search RPC
+-- Run this in Supabase SQL Editor
+--
+-- search_workers built a 7-stage PostgREST filter chain per call and the
+-- resulting SQL was re-parsed on every request. This function carries the
+-- whole search - optional filters, keyset cursor, ordering, limit - so one
+-- RPC call hits one cached plan.
+
+CREATE OR REPLACE FUNCTION rpc_search_workers(
+    spec TEXT DEFAULT NULL,
+    loc TEXT DEFAULT NULL,
+    min_trust INTEGER DEFAULT 0,
+    min_rating NUMERIC DEFAULT 0,
+    lim INTEGER DEFAULT 20,
+    last_trust INTEGER DEFAULT NULL,
+    last_id UUID DEFAULT NULL
+)
+RETURNS SETOF workers
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT *
+    FROM workers
+    WHERE is_active = TRUE
+      AND (spec IS NULL OR specializations @> ARRAY[spec])
+      AND (loc IS NULL OR location ILIKE '%' || loc || '%')
+      AND (min_trust <= 0 OR trust_score >= min_trust)
+      AND (min_rating <= 0 OR gmaps_rating >= min_rating)
+      AND (
+          last_trust IS NULL
+          OR trust_score < last_trust
+          OR (trust_score = last_trust AND id > last_id)
+      )
+    ORDER BY trust_score DESC, id
+    LIMIT lim;
+$$;
+
+COMMENT ON FUNCTION rpc_search_workers(TEXT, TEXT, INTEGER, NUMERIC, INTEGER, INTEGER, UUID) IS
+    'Filtered worker search with keyset pagination on (trust_score DESC, id); uses idx_workers_trust_id.';
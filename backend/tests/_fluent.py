@@ -0,0 +1,40 @@
+"""
+Lightweight fluent stub for Supabase query-builder chains in tests.
+
+MagicMock records every attribute access and call through a fairly heavy
+dispatch path, which adds up across hundreds of mocked builder chains.
+FluentStub replaces the nested ``mock.table.return_value.select.return_value``
+wiring with a single slotted object that chains through any method call
+and returns canned data from ``.execute().data``.
+"""
+
+
+class FluentStub:
+    """Chainable no-op stand-in for a Supabase query builder"""
+
+    __slots__ = ("_calls", "_data")
+
+    def __init__(self, data=None):
+        self._calls = []
+        self._data = data
+
+    def __getattr__(self, name):
+        def _record(*args, **kwargs):
+            # Single list append so recording stays atomic even when
+            # chains run concurrently via asyncio.to_thread
+            self._calls.append((name, args, kwargs))
+            return self
+
+        return _record
+
+    @property
+    def data(self):
+        return self._data
+
+    def calls_to(self, name):
+        """Return (args, kwargs) tuples for each call made via `name`"""
+        return [
+            (args, kwargs)
+            for called, args, kwargs in self._calls
+            if called == name
+        ]
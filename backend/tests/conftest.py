@@ -5,20 +5,102 @@ Pytest configuration and shared fixtures for testing
 import pytest
 from fastapi.testclient import TestClient
 
+from app.integrations.supabase import get_supabase_client
 from app.main import app
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_supabase_client_cache():
+    """
+    Clear the cached Supabase client between tests.
+
+    get_supabase_client is an lru_cache singleton; without this, a client
+    created (or mocked) in one test would leak into the next.
+    """
+    get_supabase_client.cache_clear()
+    yield
+    get_supabase_client.cache_clear()
+
+
+@pytest.fixture(scope="session")
 def client():
     """
-    FastAPI test client fixture
+    FastAPI test client fixture, shared across the session.
+
+    Entering the context manager runs app lifespan (config load, client
+    init) exactly once for the whole test run instead of per test.
 
     Usage:
         def test_health(client):
             response = client.get("/health")
             assert response.status_code == 200
     """
-    return TestClient(app)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def real_postgrest_client():
+    """
+    Factory for a real PostgREST client backed by httpx.MockTransport.
+
+    Unlike mock chains, this runs production URL building and filter
+    serialization for real — a misspelled filter method or bad operator
+    encoding fails the test — while the transport answers with canned
+    JSON and logs every request for assertions.
+
+    Usage:
+        def test_wire_format(real_postgrest_client):
+            requests_log = []
+            client = real_postgrest_client(requests_log, [{"id": "w1"}])
+    """
+    import httpx
+    from postgrest import SyncPostgrestClient
+
+    clients = []
+
+    def _build(requests_log: list, payload, status_code: int = 200):
+        def handler(request):
+            requests_log.append(request)
+            return httpx.Response(status_code, json=payload)
+
+        http_client = httpx.Client(
+            transport=httpx.MockTransport(handler),
+            base_url="http://testserver/rest/v1",
+        )
+        client = SyncPostgrestClient(
+            "http://testserver/rest/v1", http_client=http_client
+        )
+        clients.append(client)
+        return client
+
+    yield _build
+
+    for client in clients:
+        client.session.close()
+
+
+@pytest.fixture(scope="session")
+def override_factory():
+    """
+    Binder for the shared base-dict/override-factory test pattern.
+
+    Test modules keep a session-scoped read-only MappingProxyType of
+    their canonical payload and expose `override_factory(base)` as their
+    factory fixture; each call merges per-test field overrides onto a
+    fresh mutable copy, so tests spell out only the fields they vary and
+    mutation never leaks into the shared base.
+
+    Usage:
+        @pytest.fixture
+        def worker(override_factory, base_worker):
+            return override_factory(base_worker)
+    """
+
+    def bind(base):
+        return lambda **overrides: {**base, **overrides}
+
+    return bind
 
 
 @pytest.fixture
@@ -15,6 +15,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from app.services.background_jobs import BackgroundJobService, get_scheduler
+from tests._fluent import FluentStub
 
 
 class TestBackgroundJobService:
@@ -38,8 +39,8 @@ class TestBackgroundJobService:
         assert service.is_running is False
         assert len(service.scheduler.get_jobs()) == 0
 
-    @pytest.mark.asyncio
     @patch("app.services.background_jobs.settings")
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_start_when_enabled(self, mock_settings):
         """Should start scheduler and register jobs when enabled"""
         mock_settings.enable_background_jobs = True
@@ -60,8 +61,25 @@ class TestBackgroundJobService:
         # Cleanup
         service.stop()
 
-    @pytest.mark.asyncio
     @patch("app.services.background_jobs.settings")
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_jobs_configured_with_misfire_protection(self, mock_settings):
+        """Should register jobs with coalescing and a misfire grace window"""
+        mock_settings.enable_background_jobs = True
+
+        service = BackgroundJobService()
+        service.start()
+
+        for job in service.scheduler.get_jobs():
+            assert job.max_instances == 1
+            assert job.coalesce is True
+            assert job.misfire_grace_time == 300
+
+        # Cleanup
+        service.stop()
+
+    @patch("app.services.background_jobs.settings")
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_stop_gracefully(self, mock_settings):
         """Should stop scheduler gracefully"""
         mock_settings.enable_background_jobs = True
@@ -84,8 +102,8 @@ class TestBackgroundJobService:
 class TestCacheRefresh:
     """Test cache refresh job"""
 
-    @pytest.mark.asyncio
     @patch("app.services.background_jobs.BackgroundJobService._refresh_specialization_cache")
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_refresh_popular_workers(self, mock_refresh):
         """Should refresh cache for all popular specializations"""
         mock_refresh.return_value = None
@@ -103,8 +121,8 @@ class TestCacheRefresh:
         assert "kitchen" in call_args_list
         assert "general" in call_args_list
 
-    @pytest.mark.asyncio
     @patch("app.services.background_jobs.BackgroundJobService._refresh_specialization_cache")
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_refresh_continues_on_error(self, mock_refresh):
         """Should continue refreshing other specializations if one fails"""
         # First call fails, rest succeed
@@ -121,12 +139,12 @@ class TestCacheRefresh:
         # Should still call all 4 specializations
         assert mock_refresh.call_count == 4
 
-    @pytest.mark.asyncio
     @patch("app.services.background_jobs.scrape_google_maps_workers")
     @patch("app.services.background_jobs.deduplicate_workers")
     @patch("app.services.background_jobs.calculate_trust_score")
     @patch("app.services.background_jobs.bulk_insert_workers")
     @patch("app.services.background_jobs.update_worker_scraped_timestamp")
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_refresh_specialization_cache_full_workflow(
         self,
         mock_update_timestamp,
@@ -173,8 +191,8 @@ class TestCacheRefresh:
         mock_bulk_insert.assert_called_once()
         mock_update_timestamp.assert_called_once_with(["worker-1", "worker-2"])
 
-    @pytest.mark.asyncio
     @patch("app.services.background_jobs.scrape_google_maps_workers")
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_refresh_specialization_handles_empty_results(self, mock_scrape):
         """Should handle empty scrape results gracefully"""
         mock_scrape.return_value = []
@@ -189,24 +207,16 @@ class TestCacheRefresh:
 class TestTrustScoreRecalculation:
     """Test trust score recalculation job"""
 
-    @pytest.mark.asyncio
+    @patch("app.services.background_jobs.bulk_update_worker_trust")
     @patch("app.services.background_jobs.get_supabase_client")
     @patch("app.services.background_jobs.calculate_trust_score")
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_recalculate_stale_trust_scores(
-        self, mock_calculate_trust, mock_get_supabase
+        self, mock_calculate_trust, mock_get_supabase, mock_bulk_update
     ):
         """Should recalculate trust scores for stale workers"""
-        # Mock Supabase client
-        mock_supabase = MagicMock()
-        mock_get_supabase.return_value = mock_supabase
-
-        # Mock stale workers query
-        mock_select = MagicMock()
-        mock_supabase.table.return_value.select.return_value = mock_select
-        mock_select.eq.return_value = mock_select
-        mock_select.or_.return_value = mock_select
-        mock_select.limit.return_value = mock_select
-        mock_select.execute.return_value.data = [
+        # Fluent stub chains through the whole builder, returning stale workers
+        mock_supabase = FluentStub(data=[
             {
                 "id": "worker-1",
                 "business_name": "Worker 1",
@@ -223,7 +233,8 @@ class TestTrustScoreRecalculation:
                 "gmaps_rating": 4.2,
                 "last_score_calculated_at": None,
             },
-        ]
+        ])
+        mock_get_supabase.return_value = mock_supabase
 
         # Mock trust calculation
         mock_calculate_trust.return_value = MagicMock(
@@ -231,12 +242,7 @@ class TestTrustScoreRecalculation:
             level=MagicMock(value="HIGH"),
             breakdown={"source": 24, "reviews": 15},
         )
-
-        # Mock update query
-        mock_update = MagicMock()
-        mock_supabase.table.return_value.update.return_value = mock_update
-        mock_update.eq.return_value = mock_update
-        mock_update.execute.return_value = None
+        mock_bulk_update.return_value = 2
 
         service = BackgroundJobService()
         await service.recalculate_stale_trust_scores()
@@ -244,52 +250,45 @@ class TestTrustScoreRecalculation:
         # Verify trust calculation called for both workers
         assert mock_calculate_trust.call_count == 2
 
-        # Verify update called for both workers
-        assert mock_update.eq.call_count == 2
+        # Verify both workers written in a single bulk trust update
+        mock_bulk_update.assert_awaited_once()
+        update_rows = mock_bulk_update.await_args[0][0]
+        assert len(update_rows) == 2
+        assert {row["id"] for row in update_rows} == {"worker-1", "worker-2"}
+        assert update_rows[0]["trust_score"] == 75
 
-    @pytest.mark.asyncio
+    @patch("app.services.background_jobs.bulk_update_worker_trust")
     @patch("app.services.background_jobs.get_supabase_client")
-    async def test_recalculate_handles_no_stale_workers(self, mock_get_supabase):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_recalculate_handles_no_stale_workers(
+        self, mock_get_supabase, mock_bulk_update
+    ):
         """Should handle case when no stale workers found"""
-        # Mock Supabase client
-        mock_supabase = MagicMock()
+        # Fluent stub with empty results
+        mock_supabase = FluentStub(data=[])
         mock_get_supabase.return_value = mock_supabase
 
-        # Mock empty results
-        mock_select = MagicMock()
-        mock_supabase.table.return_value.select.return_value = mock_select
-        mock_select.eq.return_value = mock_select
-        mock_select.or_.return_value = mock_select
-        mock_select.limit.return_value = mock_select
-        mock_select.execute.return_value.data = []
-
         service = BackgroundJobService()
         await service.recalculate_stale_trust_scores()
 
-        # Should not raise exception
-        mock_supabase.table.assert_called()
+        # Should not raise exception; query ran but nothing was written
+        assert mock_supabase.calls_to("table")
+        mock_bulk_update.assert_not_awaited()
 
-    @pytest.mark.asyncio
+    @patch("app.services.background_jobs.bulk_update_worker_trust")
     @patch("app.services.background_jobs.get_supabase_client")
     @patch("app.services.background_jobs.calculate_trust_score")
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_recalculate_continues_on_error(
-        self, mock_calculate_trust, mock_get_supabase
+        self, mock_calculate_trust, mock_get_supabase, mock_bulk_update
     ):
         """Should continue recalculating even if one worker fails"""
-        # Mock Supabase client
-        mock_supabase = MagicMock()
-        mock_get_supabase.return_value = mock_supabase
-
-        # Mock stale workers
-        mock_select = MagicMock()
-        mock_supabase.table.return_value.select.return_value = mock_select
-        mock_select.eq.return_value = mock_select
-        mock_select.or_.return_value = mock_select
-        mock_select.limit.return_value = mock_select
-        mock_select.execute.return_value.data = [
+        # Fluent stub returning two stale workers
+        mock_supabase = FluentStub(data=[
             {"id": "worker-1", "business_name": "Worker 1"},
             {"id": "worker-2", "business_name": "Worker 2"},
-        ]
+        ])
+        mock_get_supabase.return_value = mock_supabase
 
         # First calculation fails, second succeeds
         mock_calculate_trust.side_effect = [
@@ -297,27 +296,24 @@ class TestTrustScoreRecalculation:
             MagicMock(score=75, level=MagicMock(value="HIGH"), breakdown={}),
         ]
 
-        # Mock update
-        mock_update = MagicMock()
-        mock_supabase.table.return_value.update.return_value = mock_update
-        mock_update.eq.return_value = mock_update
-        mock_update.execute.return_value = None
-
         service = BackgroundJobService()
         await service.recalculate_stale_trust_scores()
 
         # Should call both calculations
         assert mock_calculate_trust.call_count == 2
 
-        # Should only update successful one
-        assert mock_update.eq.call_count == 1
+        # Should only write the successful one
+        mock_bulk_update.assert_awaited_once()
+        update_rows = mock_bulk_update.await_args[0][0]
+        assert len(update_rows) == 1
+        assert update_rows[0]["id"] == "worker-2"
 
 
 class TestScrapeJobCleanup:
     """Test scrape job cleanup"""
 
-    @pytest.mark.asyncio
     @patch("app.services.background_jobs.get_supabase_client")
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_cleanup_old_scrape_jobs(self, mock_get_supabase):
         """Should delete old completed/failed scrape jobs"""
         # Mock Supabase client
@@ -343,8 +339,8 @@ class TestScrapeJobCleanup:
         mock_delete.in_.assert_called_once_with("status", ["completed", "failed"])
         mock_delete.lt.assert_called_once()  # Called with cutoff date
 
-    @pytest.mark.asyncio
     @patch("app.services.background_jobs.get_supabase_client")
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_cleanup_handles_no_old_jobs(self, mock_get_supabase):
         """Should handle case when no old jobs to cleanup"""
         # Mock Supabase client
@@ -368,8 +364,8 @@ class TestScrapeJobCleanup:
 class TestManualCacheRefresh:
     """Test manual cache refresh trigger"""
 
-    @pytest.mark.asyncio
     @patch("app.services.background_jobs.BackgroundJobService._refresh_specialization_cache")
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_trigger_manual_cache_refresh(self, mock_refresh):
         """Should manually trigger cache refresh for specific specialization"""
         mock_refresh.return_value = None
@@ -380,8 +376,8 @@ class TestManualCacheRefresh:
         # Verify refresh called with correct parameters
         mock_refresh.assert_called_once_with("pool", "Canggu")
 
-    @pytest.mark.asyncio
     @patch("app.services.background_jobs.BackgroundJobService._refresh_specialization_cache")
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_manual_refresh_defaults_to_bali(self, mock_refresh):
         """Should default to Bali location if not specified"""
         mock_refresh.return_value = None
@@ -4,24 +4,18 @@ Tests for health check endpoints
 
 import pytest
 from unittest.mock import patch, MagicMock
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-
-client = TestClient(app)
 
 
 class TestHealthCheck:
     """Tests for basic health check endpoint"""
 
-    def test_health_check_returns_200(self):
+    def test_health_check_returns_200(self, client):
         """Should return 200 OK"""
         response = client.get("/health/")
 
         assert response.status_code == 200
 
-    def test_health_check_response_body(self):
+    def test_health_check_response_body(self, client):
         """Should return healthy status"""
         response = client.get("/health/")
 
@@ -33,7 +27,7 @@ class TestHealthCheck:
 class TestReadinessCheck:
     """Tests for readiness check endpoint"""
 
-    def test_readiness_returns_200(self):
+    def test_readiness_returns_200(self, client):
         """Should return 200 even when not ready"""
         with patch("app.routes.health.get_supabase_client") as mock_client:
             # Simulate database failure
@@ -43,7 +37,7 @@ class TestReadinessCheck:
 
             assert response.status_code == 200
 
-    def test_readiness_all_checks_pass(self):
+    def test_readiness_all_checks_pass(self, client):
         """Should return ready when all checks pass"""
         with patch("app.routes.health.get_supabase_client") as mock_client:
             mock_response = MagicMock()
@@ -59,7 +53,7 @@ class TestReadinessCheck:
             assert data["checks"]["config"] is True
             assert data["checks"]["database"] is True
 
-    def test_readiness_database_failure(self):
+    def test_readiness_database_failure(self, client):
         """Should return not_ready when database fails"""
         with patch("app.routes.health.get_supabase_client") as mock_client:
             mock_client.return_value.table.return_value.select.return_value.limit.return_value.execute.side_effect = Exception("Connection refused")
@@ -73,16 +67,43 @@ class TestReadinessCheck:
             assert data["checks"]["api"] is True
 
 
+class TestReadinessCache:
+    """Tests for readiness probe caching"""
+
+    def test_readiness_cache_hit(self, client):
+        """Second call within the TTL should skip the database probe"""
+        import app.routes.health as health
+
+        health._readiness_cache = None
+        try:
+            with patch("app.routes.health.get_supabase_client") as mock_client:
+                mock_response = MagicMock()
+                mock_response.data = []
+                mock_client.return_value.table.return_value.select.return_value.limit.return_value.execute.return_value = mock_response
+
+                first = client.get("/api/v1/health/ready")
+                second = client.get("/api/v1/health/ready")
+
+                assert first.headers["X-Cache"] == "MISS"
+                assert second.headers["X-Cache"] == "HIT"
+                assert second.json() == first.json()
+
+                # Database probed exactly once across both requests
+                mock_client.return_value.table.assert_called_once()
+        finally:
+            health._readiness_cache = None
+
+
 class TestMetricsEndpoint:
     """Tests for metrics endpoint"""
 
-    def test_metrics_returns_200(self):
+    def test_metrics_returns_200(self, client):
         """Should return 200 OK"""
         response = client.get("/health/metrics")
 
         assert response.status_code == 200
 
-    def test_metrics_includes_environment(self):
+    def test_metrics_includes_environment(self, client):
         """Should include environment info"""
         response = client.get("/health/metrics")
 
@@ -15,7 +15,7 @@ from unittest.mock import MagicMock, patch, AsyncMock
 class TestGetCachedMaterialPrice:
     """Tests for get_cached_material_price function"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_returns_none_when_no_match(self):
         """Should return None when material is not found"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -31,7 +31,7 @@ class TestGetCachedMaterialPrice:
 
             assert result is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_returns_cached_price_when_fresh(self):
         """Should return cached price data when within 7-day TTL"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -62,7 +62,7 @@ class TestGetCachedMaterialPrice:
             assert result["price_avg"] == 85000
             assert result["is_fresh"] is True
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_returns_stale_when_older_than_7_days(self):
         """Should mark cache as stale when price_updated_at > 7 days ago"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -84,7 +84,7 @@ class TestGetCachedMaterialPrice:
             assert result is not None
             assert result["is_fresh"] is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_returns_none_when_no_price_data(self):
         """Should return None when material exists but has no price data"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -107,7 +107,7 @@ class TestGetCachedMaterialPrice:
 class TestSaveMaterialPriceCache:
     """Tests for save_material_price_cache function"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_updates_existing_material_prices(self):
         """Should update price fields for existing material"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -137,7 +137,7 @@ class TestSaveMaterialPriceCache:
             assert call_args["price_max"] == 90000
             assert call_args["price_sample_size"] == 3
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_creates_new_material_when_not_found(self):
         """Should create new material entry when not in database"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -169,7 +169,7 @@ class TestSaveMaterialPriceCache:
             assert call_args["category"] == "dynamic"  # Dynamic entries marked
             assert call_args["unit"] == "pcs"  # Default unit for unknown materials
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_returns_none_for_empty_prices(self):
         """Should return None when prices list is empty"""
         from app.integrations.supabase import save_material_price_cache
@@ -178,7 +178,7 @@ class TestSaveMaterialPriceCache:
 
         assert result is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_returns_none_for_invalid_prices(self):
         """Should return None when all prices are invalid"""
         from app.integrations.supabase import save_material_price_cache
@@ -196,7 +196,7 @@ class TestSaveMaterialPriceCache:
 class TestGetMaterialByAlias:
     """Tests for get_material_by_alias function"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_finds_material_by_alias(self):
         """Should find material when alias matches"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -215,7 +215,7 @@ class TestGetMaterialByAlias:
             assert result is not None
             assert result["id"] == "mat-123"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_returns_none_when_alias_not_found(self):
         """Should return None when alias doesn't match any material"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -233,7 +233,7 @@ class TestGetMaterialByAlias:
 class TestGetStaleMaterials:
     """Tests for get_stale_materials function"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_returns_stale_materials(self):
         """Should return materials with old or missing price data"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -460,7 +460,7 @@ class TestExtractSoldCount:
 class TestScrapeTokopediaPricesIntegration:
     """Integration tests for scrape_tokopedia_prices with mocked dependencies"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_returns_from_memory_cache_first(self):
         """Should return from in-memory cache without hitting Supabase or Apify"""
         with patch("app.utils.cache.price_scrape_cache") as mock_cache:
@@ -476,7 +476,7 @@ class TestScrapeTokopediaPricesIntegration:
             assert result[0]["name"] == "Cached Product"
             mock_cache.get.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_returns_from_supabase_when_memory_miss(self):
         """Should return from Supabase cache when in-memory cache misses"""
         with patch("app.utils.cache.price_scrape_cache") as mock_cache:
@@ -504,7 +504,7 @@ class TestScrapeTokopediaPricesIntegration:
                 # Should warm in-memory cache
                 mock_cache.set.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_scrapes_apify_when_all_caches_miss(self):
         """Should call Apify when both caches miss"""
         with patch("app.utils.cache.price_scrape_cache") as mock_cache:
@@ -32,7 +32,7 @@ class TestGetSupabaseClient:
 class TestProjectOperations:
     """Tests for project CRUD operations"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_save_project(self):
         """Should insert project and return with ID"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -47,7 +47,7 @@ class TestProjectOperations:
             assert result["id"] == "uuid-123"
             mock_client.return_value.table.assert_called_with("projects")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_project(self):
         """Should retrieve project by ID"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -61,7 +61,7 @@ class TestProjectOperations:
 
             assert result["id"] == "uuid-123"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_project_not_found(self):
         """Should return None for non-existent project"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -75,7 +75,7 @@ class TestProjectOperations:
 
             assert result is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_update_project_status(self):
         """Should update project status"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -92,7 +92,7 @@ class TestProjectOperations:
 class TestMaterialOperations:
     """Tests for material CRUD operations"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_material_by_code(self):
         """Should retrieve material by code"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -106,7 +106,7 @@ class TestMaterialOperations:
 
             assert result["material_code"] == "MAT001"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_search_materials(self):
         """Should search materials by name"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -123,7 +123,7 @@ class TestMaterialOperations:
 
             assert len(result) == 2
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_search_materials_empty(self):
         """Should return empty list for no matches"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -141,7 +141,7 @@ class TestMaterialOperations:
 class TestWorkerOperations:
     """Tests for worker CRUD operations"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_worker_by_id(self):
         """Should retrieve worker by ID"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -155,7 +155,7 @@ class TestWorkerOperations:
 
             assert result["name"] == "Ahmad"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_save_worker(self):
         """Should insert new worker"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -173,7 +173,7 @@ class TestWorkerOperations:
 class TestPaymentOperations:
     """Tests for payment CRUD operations"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_save_payment(self):
         """Should insert payment record"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -188,7 +188,7 @@ class TestPaymentOperations:
             assert result["id"] == "pay-123"
             mock_client.return_value.table.assert_called_with("payments")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_payment_by_gateway_id(self):
         """Should retrieve payment by Midtrans transaction ID"""
         with patch("app.integrations.supabase.get_supabase_client") as mock_client:
@@ -7,44 +7,44 @@ Tests cover:
 - Worker search with multiple filters
 - Trust score updates with timestamps
 - Scraped timestamp bulk updates
+
+Query-builder chains are mocked with FluentStub rather than nested
+MagicMocks: one object per test instead of 7-10 child mocks wired
+together via return_value.
 """
 
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
 from app.integrations.supabase import (
+    INSERT_CHUNK_SIZE,
+    ScrapedTimestampBatcher,
     bulk_insert_workers,
+    bulk_update_worker_trust,
     get_cached_workers,
     search_workers,
     update_worker_scraped_timestamp,
     update_worker_trust,
 )
+from tests._fluent import FluentStub
+
+# One event loop for the whole module: every test here is async with all
+# I/O mocked, so per-test loop setup was pure overhead
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 class TestBulkInsertWorkers:
     """Test bulk worker insertion with upsert logic"""
 
-    @pytest.mark.asyncio
     @patch("app.integrations.supabase.get_supabase_client")
     async def test_inserts_multiple_workers(self, mock_get_client):
         """Should insert multiple workers at once"""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Mock response
-        mock_table = MagicMock()
-        mock_upsert = MagicMock()
-        mock_execute = MagicMock()
-        mock_execute.data = [
+        stub = FluentStub(data=[
             {"id": "worker-1", "business_name": "Bali Pool Service"},
             {"id": "worker-2", "business_name": "Canggu Construction"},
-        ]
-
-        mock_client.table.return_value = mock_table
-        mock_table.upsert.return_value = mock_upsert
-        mock_upsert.execute.return_value = mock_execute
+        ])
+        mock_get_client.return_value = stub
 
         workers = [
             {"business_name": "Bali Pool Service", "gmaps_place_id": "ChIJ1"},
@@ -54,72 +54,159 @@ class TestBulkInsertWorkers:
         result = await bulk_insert_workers(workers)
 
         # Verify upsert called with gmaps_place_id conflict
-        mock_table.upsert.assert_called_once_with(
-            workers, on_conflict="gmaps_place_id"
-        )
+        assert stub.calls_to("upsert") == [
+            ((workers,), {"on_conflict": "gmaps_place_id"})
+        ]
         assert len(result) == 2
         assert result[0]["business_name"] == "Bali Pool Service"
 
-    @pytest.mark.asyncio
     @patch("app.integrations.supabase.get_supabase_client")
     async def test_handles_empty_list(self, mock_get_client):
         """Should handle empty worker list gracefully"""
         result = await bulk_insert_workers([])
         assert result == []
 
-    @pytest.mark.asyncio
+        # Empty input returns before the client is even dereferenced
+        mock_get_client.assert_not_called()
+
     @patch("app.integrations.supabase.get_supabase_client")
     async def test_handles_no_data_response(self, mock_get_client):
         """Should handle empty response from database"""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_table = MagicMock()
-        mock_upsert = MagicMock()
-        mock_execute = MagicMock()
-        mock_execute.data = None  # No data returned
-
-        mock_client.table.return_value = mock_table
-        mock_table.upsert.return_value = mock_upsert
-        mock_upsert.execute.return_value = mock_execute
+        stub = FluentStub(data=None)  # No data returned
+        mock_get_client.return_value = stub
 
         workers = [{"business_name": "Test", "gmaps_place_id": "ChIJ1"}]
         result = await bulk_insert_workers(workers)
 
         assert result == []
 
+    @patch("app.integrations.supabase.get_supabase_client")
+    async def test_chunks_large_batches(self, mock_get_client):
+        """Should split large batches into chunked upsert requests"""
+        stub = FluentStub(data=[{"id": "worker-x"}])
+        mock_get_client.return_value = stub
+
+        workers = [
+            {"business_name": f"Worker {i}", "gmaps_place_id": f"ChIJ{i}"}
+            for i in range(5)
+        ]
+
+        result = await bulk_insert_workers(workers, chunk_size=2)
+
+        # 5 workers at chunk_size=2 → 3 upsert calls (2 + 2 + 1 rows)
+        upsert_calls = stub.calls_to("upsert")
+        assert len(upsert_calls) == 3
+        chunk_lengths = [len(call[0][0]) for call in upsert_calls]
+        assert sorted(chunk_lengths, reverse=True) == [2, 2, 1]
+
+        # One row returned per chunk
+        assert len(result) == 3
+
+    @patch("app.integrations.supabase.get_supabase_client")
+    async def test_default_chunk_size_splits_oversized_batches(self, mock_get_client):
+        """Should issue two upserts when rows exceed the default chunk size"""
+        stub = FluentStub(data=[])
+        mock_get_client.return_value = stub
+
+        workers = [
+            {"business_name": f"Worker {i}", "gmaps_place_id": f"ChIJ{i}"}
+            for i in range(INSERT_CHUNK_SIZE + 1)
+        ]
+
+        await bulk_insert_workers(workers)
+
+        # One full chunk plus a single-row remainder
+        upsert_calls = stub.calls_to("upsert")
+        assert len(upsert_calls) == 2
+        chunk_lengths = [len(call[0][0]) for call in upsert_calls]
+        assert sorted(chunk_lengths, reverse=True) == [INSERT_CHUNK_SIZE, 1]
+
+    @patch("app.integrations.supabase.get_supabase_client")
+    async def test_runs_chunk_upserts_off_event_loop(self, mock_get_client):
+        """Should dispatch one to_thread upsert per chunk"""
+        import asyncio
+
+        mock_get_client.return_value = FluentStub(data=[])
+
+        workers = [
+            {"business_name": f"Worker {i}", "gmaps_place_id": f"ChIJ{i}"}
+            for i in range(5)
+        ]
+
+        real_to_thread = asyncio.to_thread
+        with patch("asyncio.to_thread", side_effect=real_to_thread) as mock_to_thread:
+            await bulk_insert_workers(workers, chunk_size=2)
+
+        # 5 workers at chunk_size=2 → 3 threaded upserts
+        assert mock_to_thread.call_count == 3
+
+
+class TestCopyInsertWorkers:
+    """Test the direct-COPY bulk load path"""
+
+    async def test_copy_mode_streams_records_to_staging(self):
+        """Should COPY records into staging and merge in one statement"""
+        import sys
+        from unittest.mock import AsyncMock, MagicMock
+
+        from app.integrations.supabase import _COPY_COLUMNS
+
+        mock_conn = AsyncMock()
+        mock_asyncpg = MagicMock()
+        mock_asyncpg.connect = AsyncMock(return_value=mock_conn)
+
+        mock_settings = MagicMock()
+        mock_settings.supabase_direct_dsn = "postgresql://direct"
+
+        workers = [
+            {"business_name": "Bali Pool Service", "gmaps_place_id": "ChIJ1"},
+            {"business_name": "Canggu Construction", "gmaps_place_id": "ChIJ2"},
+        ]
+
+        with patch.dict(sys.modules, {"asyncpg": mock_asyncpg}), patch(
+            "app.integrations.supabase.get_settings", return_value=mock_settings
+        ):
+            result = await bulk_insert_workers(workers, mode="copy")
+
+        assert result == workers
+        mock_conn.copy_records_to_table.assert_called_once()
+        copy_kwargs = mock_conn.copy_records_to_table.call_args[1]
+        assert copy_kwargs["columns"] == list(_COPY_COLUMNS)
+        assert len(copy_kwargs["records"]) == 2
+        mock_conn.close.assert_awaited_once()
+
+    async def test_copy_mode_requires_direct_dsn(self):
+        """Should refuse copy mode without a direct DSN configured"""
+        import sys
+        from unittest.mock import AsyncMock, MagicMock
+
+        mock_settings = MagicMock()
+        mock_settings.supabase_direct_dsn = None
+
+        with patch.dict(sys.modules, {"asyncpg": MagicMock(connect=AsyncMock())}), patch(
+            "app.integrations.supabase.get_settings", return_value=mock_settings
+        ):
+            with pytest.raises(ValueError, match="supabase_direct_dsn"):
+                await bulk_insert_workers(
+                    [{"business_name": "Test", "gmaps_place_id": "ChIJ1"}],
+                    mode="copy",
+                )
+
 
 class TestGetCachedWorkers:
     """Test cache checking for recent scrapes"""
 
-    @pytest.mark.asyncio
     @patch("app.integrations.supabase.get_supabase_client")
     async def test_returns_fresh_cached_workers(self, mock_get_client):
         """Should return workers if cache is fresh"""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Mock query chain
-        mock_table = MagicMock()
-        mock_select = MagicMock()
-        mock_contains = MagicMock()
-        mock_eq = MagicMock()
-        mock_gte = MagicMock()
-        mock_order = MagicMock()
-        mock_execute = MagicMock()
-
-        mock_execute.data = [
-            {"id": "worker-1", "business_name": "Bali Pool", "trust_score": 85},
-            {"id": "worker-2", "business_name": "Pool Pro", "trust_score": 78},
-        ]
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.contains.return_value = mock_contains
-        mock_contains.eq.return_value = mock_eq
-        mock_eq.gte.return_value = mock_gte
-        mock_gte.order.return_value = mock_order
-        mock_order.execute.return_value = mock_execute
+        stub = FluentStub(data={
+            "fresh": True,
+            "rows": [
+                {"id": "worker-1", "business_name": "Bali Pool", "trust_score": 85},
+                {"id": "worker-2", "business_name": "Pool Pro", "trust_score": 78},
+            ],
+        })
+        mock_get_client.return_value = stub
 
         result = await get_cached_workers("pool", max_age_hours=168)
 
@@ -127,249 +214,177 @@ class TestGetCachedWorkers:
         assert len(result) == 2
         assert result[0]["trust_score"] == 85
 
-    @pytest.mark.asyncio
     @patch("app.integrations.supabase.get_supabase_client")
     async def test_returns_none_for_cache_miss(self, mock_get_client):
         """Should return None if no cached workers found"""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Mock empty response
-        mock_table = MagicMock()
-        mock_select = MagicMock()
-        mock_contains = MagicMock()
-        mock_eq = MagicMock()
-        mock_gte = MagicMock()
-        mock_order = MagicMock()
-        mock_execute = MagicMock()
-        mock_execute.data = []  # No workers found
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.contains.return_value = mock_contains
-        mock_contains.eq.return_value = mock_eq
-        mock_eq.gte.return_value = mock_gte
-        mock_gte.order.return_value = mock_order
-        mock_order.execute.return_value = mock_execute
+        mock_get_client.return_value = FluentStub(data={"fresh": False, "rows": []})
 
         result = await get_cached_workers("pool")
 
         assert result is None
 
-    @pytest.mark.asyncio
     @patch("app.integrations.supabase.get_supabase_client")
     async def test_uses_custom_cache_age(self, mock_get_client):
         """Should respect custom max_age_hours parameter"""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_table = MagicMock()
-        mock_select = MagicMock()
-        mock_contains = MagicMock()
-        mock_eq = MagicMock()
-        mock_gte = MagicMock()
-        mock_order = MagicMock()
-        mock_execute = MagicMock()
-        mock_execute.data = []
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.contains.return_value = mock_contains
-        mock_contains.eq.return_value = mock_eq
-        mock_eq.gte.return_value = mock_gte
-        mock_gte.order.return_value = mock_order
-        mock_order.execute.return_value = mock_execute
+        stub = FluentStub(data={"fresh": False, "rows": []})
+        mock_get_client.return_value = stub
 
         await get_cached_workers("pool", max_age_hours=24)
 
-        # Verify cutoff time is 24 hours ago (approximately)
-        call_args = mock_eq.gte.call_args
-        assert call_args is not None
+        # Verify max_age_hours is forwarded to the RPC
+        assert stub.calls_to("rpc") == [
+            (
+                (
+                    "get_cached_workers_or_nothing",
+                    {"spec": "pool", "max_age_hours": 24},
+                ),
+                {},
+            )
+        ]
 
 
 class TestSearchWorkers:
     """Test flexible worker search with filters"""
 
-    @pytest.mark.asyncio
+    @staticmethod
+    def _rpc_params(stub):
+        """Parameter dict of the single rpc_search_workers call"""
+        rpc_calls = stub.calls_to("rpc")
+        assert len(rpc_calls) == 1
+        name, params = rpc_calls[0][0]
+        assert name == "rpc_search_workers"
+        return params
+
     @patch("app.integrations.supabase.get_supabase_client")
     async def test_searches_by_specialization(self, mock_get_client):
         """Should filter by specialization"""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Mock query chain
-        mock_table = MagicMock()
-        mock_select = MagicMock()
-        mock_eq = MagicMock()
-        mock_contains = MagicMock()
-        mock_order = MagicMock()
-        mock_limit = MagicMock()
-        mock_execute = MagicMock()
-        mock_execute.data = [{"id": "worker-1", "specializations": ["pool"]}]
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq
-        mock_eq.contains.return_value = mock_contains
-        mock_contains.order.return_value = mock_order
-        mock_order.limit.return_value = mock_limit
-        mock_limit.execute.return_value = mock_execute
+        stub = FluentStub(data=[{"id": "worker-1", "specializations": ["pool"]}])
+        mock_get_client.return_value = stub
 
         result = await search_workers(specialization="pool")
 
-        mock_eq.contains.assert_called_once_with("specializations", ["pool"])
+        assert self._rpc_params(stub)["spec"] == "pool"
         assert len(result) == 1
 
-    @pytest.mark.asyncio
     @patch("app.integrations.supabase.get_supabase_client")
     async def test_searches_by_location(self, mock_get_client):
-        """Should filter by location using ILIKE"""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_table = MagicMock()
-        mock_select = MagicMock()
-        mock_eq = MagicMock()
-        mock_ilike = MagicMock()
-        mock_order = MagicMock()
-        mock_limit = MagicMock()
-        mock_execute = MagicMock()
-        mock_execute.data = [{"id": "worker-1", "location": "Canggu"}]
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq
-        mock_eq.ilike.return_value = mock_ilike
-        mock_ilike.order.return_value = mock_order
-        mock_order.limit.return_value = mock_limit
-        mock_limit.execute.return_value = mock_execute
+        """Should filter by location"""
+        stub = FluentStub(data=[{"id": "worker-1", "location": "Canggu"}])
+        mock_get_client.return_value = stub
 
         result = await search_workers(location="Canggu")
 
-        mock_eq.ilike.assert_called_once_with("location", "%Canggu%")
+        assert self._rpc_params(stub)["loc"] == "Canggu"
         assert len(result) == 1
 
-    @pytest.mark.asyncio
     @patch("app.integrations.supabase.get_supabase_client")
     async def test_filters_by_trust_score(self, mock_get_client):
         """Should filter by minimum trust score"""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_table = MagicMock()
-        mock_select = MagicMock()
-        mock_eq = MagicMock()
-        mock_gte = MagicMock()
-        mock_order = MagicMock()
-        mock_limit = MagicMock()
-        mock_execute = MagicMock()
-        mock_execute.data = [{"id": "worker-1", "trust_score": 85}]
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq
-        mock_eq.gte.return_value = mock_gte
-        mock_gte.order.return_value = mock_order
-        mock_order.limit.return_value = mock_limit
-        mock_limit.execute.return_value = mock_execute
+        stub = FluentStub(data=[{"id": "worker-1", "trust_score": 85}])
+        mock_get_client.return_value = stub
 
         result = await search_workers(min_trust_score=80)
 
-        mock_eq.gte.assert_called_once_with("trust_score", 80)
+        assert self._rpc_params(stub)["min_trust"] == 80
         assert len(result) == 1
 
-    @pytest.mark.asyncio
     @patch("app.integrations.supabase.get_supabase_client")
     async def test_filters_by_rating(self, mock_get_client):
         """Should filter by minimum Google Maps rating"""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_table = MagicMock()
-        mock_select = MagicMock()
-        mock_eq = MagicMock()
-        mock_gte = MagicMock()
-        mock_order = MagicMock()
-        mock_limit = MagicMock()
-        mock_execute = MagicMock()
-        mock_execute.data = [{"id": "worker-1", "gmaps_rating": 4.5}]
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq
-        mock_eq.gte.return_value = mock_gte
-        mock_gte.order.return_value = mock_order
-        mock_order.limit.return_value = mock_limit
-        mock_limit.execute.return_value = mock_execute
+        stub = FluentStub(data=[{"id": "worker-1", "gmaps_rating": 4.5}])
+        mock_get_client.return_value = stub
 
         result = await search_workers(min_rating=4.0)
 
-        mock_eq.gte.assert_called_once_with("gmaps_rating", 4.0)
+        assert self._rpc_params(stub)["min_rating"] == 4.0
         assert len(result) == 1
 
-    @pytest.mark.asyncio
     @patch("app.integrations.supabase.get_supabase_client")
     async def test_combines_multiple_filters(self, mock_get_client):
-        """Should chain multiple filters together"""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_table = MagicMock()
-        mock_select = MagicMock()
-        mock_eq = MagicMock()
-        mock_contains = MagicMock()
-        mock_ilike = MagicMock()
-        mock_gte1 = MagicMock()
-        mock_gte2 = MagicMock()
-        mock_order = MagicMock()
-        mock_limit = MagicMock()
-        mock_execute = MagicMock()
-        mock_execute.data = []
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq
-        mock_eq.contains.return_value = mock_contains
-        mock_contains.ilike.return_value = mock_ilike
-        mock_ilike.gte.return_value = mock_gte1
-        mock_gte1.gte.return_value = mock_gte2
-        mock_gte2.order.return_value = mock_order
-        mock_order.limit.return_value = mock_limit
-        mock_limit.execute.return_value = mock_execute
+        """Should forward every filter in one RPC call"""
+        stub = FluentStub(data=[])
+        mock_get_client.return_value = stub
 
         result = await search_workers(
             specialization="pool",
             location="Canggu",
             min_trust_score=80,
             min_rating=4.5,
-            limit=10
+            limit=10,
+            cursor=(90, "w0"),
         )
 
-        # Verify all filters were applied
-        mock_eq.contains.assert_called_once()
-        mock_contains.ilike.assert_called_once()
         assert result == []
+        assert self._rpc_params(stub) == {
+            "spec": "pool",
+            "loc": "Canggu",
+            "min_trust": 80,
+            "min_rating": 4.5,
+            "lim": 10,
+            "last_trust": 90,
+            "last_id": "w0",
+        }
+
+    @patch("app.integrations.supabase.get_supabase_client")
+    async def test_first_page_has_no_cursor_params(self, mock_get_client):
+        """Should omit keyset parameters without a cursor"""
+        stub = FluentStub(data=[])
+        mock_get_client.return_value = stub
+
+        await search_workers(specialization="pool")
+
+        params = self._rpc_params(stub)
+        assert "last_trust" not in params
+        assert "last_id" not in params
+
+
+class TestSearchWorkersWireFormat:
+    """Exercise real PostgREST URL building against a mock transport"""
+
+    async def test_search_serializes_to_rpc_post(self, real_postgrest_client):
+        """Should POST the parameter dict to the rpc_search_workers endpoint"""
+        import json
+
+        requests_log = []
+        client = real_postgrest_client(requests_log, [{"id": "worker-1"}])
+
+        with patch(
+            "app.integrations.supabase.get_supabase_client", return_value=client
+        ):
+            result = await search_workers(
+                specialization="pool",
+                location="Canggu",
+                min_trust_score=80,
+                min_rating=4.5,
+                limit=10,
+                cursor=(90, "w0"),
+            )
+
+        assert result == [{"id": "worker-1"}]
+        assert len(requests_log) == 1
+
+        request = requests_log[0]
+        assert request.method == "POST"
+        assert request.url.path.endswith("/rpc/rpc_search_workers")
+        assert json.loads(request.content) == {
+            "spec": "pool",
+            "loc": "Canggu",
+            "min_trust": 80,
+            "min_rating": 4.5,
+            "lim": 10,
+            "last_trust": 90,
+            "last_id": "w0",
+        }
 
 
 class TestUpdateWorkerTrust:
     """Test trust score updates"""
 
-    @pytest.mark.asyncio
     @patch("app.integrations.supabase.get_supabase_client")
     async def test_updates_trust_score_with_timestamp(self, mock_get_client):
-        """Should update trust score and set calculation timestamp"""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_table = MagicMock()
-        mock_update = MagicMock()
-        mock_eq = MagicMock()
-        mock_execute = MagicMock()
-
-        mock_client.table.return_value = mock_table
-        mock_table.update.return_value = mock_update
-        mock_update.eq.return_value = mock_eq
-        mock_eq.execute.return_value = mock_execute
+        """Should route single-worker updates through the bulk RPC"""
+        stub = FluentStub(data=1)
+        mock_get_client.return_value = stub
 
         await update_worker_trust(
             worker_id="worker-123",
@@ -378,42 +393,105 @@ class TestUpdateWorkerTrust:
             trust_breakdown={"source": 24, "reviews": 20}
         )
 
-        # Verify update called with all fields including timestamp
-        call_args = mock_table.update.call_args[0][0]
-        assert call_args["trust_score"] == 85
-        assert call_args["trust_level"] == "HIGH"
-        assert call_args["trust_breakdown"] == {"source": 24, "reviews": 20}
-        assert call_args["last_score_calculated_at"] == "now()"
+        # Verify the RPC payload carries all fields; the timestamp is
+        # stamped server-side by bulk_update_trust
+        rpc_calls = stub.calls_to("rpc")
+        assert len(rpc_calls) == 1
+        name, payload = rpc_calls[0][0]
+        assert name == "bulk_update_trust"
+        assert payload["payload"] == [{
+            "id": "worker-123",
+            "trust_score": 85,
+            "trust_level": "HIGH",
+            "trust_breakdown": {"source": 24, "reviews": 20},
+        }]
+
+    @patch("app.integrations.supabase.get_supabase_client")
+    async def test_bulk_update_uses_single_rpc(self, mock_get_client):
+        """Should send a large batch in one RPC call"""
+        stub = FluentStub(data=500)
+        mock_get_client.return_value = stub
+
+        updates = [
+            {
+                "id": f"worker-{i}",
+                "trust_score": 50,
+                "trust_level": "MEDIUM",
+                "trust_breakdown": {},
+            }
+            for i in range(500)
+        ]
+
+        updated = await bulk_update_worker_trust(updates)
+
+        assert len(stub.calls_to("rpc")) == 1
+        assert updated == 500
+
+    async def test_bulk_update_handles_empty_list(self):
+        """Should short-circuit without a round trip"""
+        assert await bulk_update_worker_trust([]) == 0
 
 
 class TestUpdateWorkerScrapedTimestamp:
     """Test bulk scraped timestamp updates"""
 
-    @pytest.mark.asyncio
     @patch("app.integrations.supabase.get_supabase_client")
     async def test_updates_multiple_workers(self, mock_get_client):
         """Should update last_scraped_at for multiple workers"""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_table = MagicMock()
-        mock_update = MagicMock()
-        mock_in = MagicMock()
-        mock_execute = MagicMock()
-
-        mock_client.table.return_value = mock_table
-        mock_table.update.return_value = mock_update
-        mock_update.in_.return_value = mock_in
-        mock_in.execute.return_value = mock_execute
+        stub = FluentStub()
+        mock_get_client.return_value = stub
 
         worker_ids = ["worker-1", "worker-2", "worker-3"]
         await update_worker_scraped_timestamp(worker_ids)
 
         # Verify IN clause used for bulk update
-        mock_update.in_.assert_called_once_with("id", worker_ids)
+        assert stub.calls_to("in_") == [(("id", worker_ids), {})]
 
-    @pytest.mark.asyncio
-    async def test_handles_empty_list(self):
+    @patch("app.integrations.supabase.get_supabase_client")
+    async def test_handles_empty_list(self, mock_get_client):
         """Should handle empty worker_ids list gracefully"""
-        # Should not raise exception
+        # Should not raise, and never touch the client or emit `id in ()`
         await update_worker_scraped_timestamp([])
+
+        mock_get_client.assert_not_called()
+
+
+class TestScrapedTimestampBatcher:
+    """Test time-windowed coalescing of per-row timestamp updates"""
+
+    async def test_coalesces_burst_into_single_flush(self):
+        """500 queued IDs within the window should flush as one update"""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        with patch(
+            "app.integrations.supabase.update_worker_scraped_timestamp",
+            new=AsyncMock(),
+        ) as mock_update:
+            batcher = ScrapedTimestampBatcher(window_ms=50)
+            for i in range(500):
+                await batcher.add(f"worker-{i}")
+
+            # Nothing sent while the window is open
+            mock_update.assert_not_awaited()
+
+            await asyncio.sleep(0.1)
+
+            mock_update.assert_awaited_once()
+            worker_ids = mock_update.call_args[0][0]
+            assert len(worker_ids) == 500
+
+    async def test_flushes_immediately_when_batch_full(self):
+        """Reaching max_batch should flush without waiting for the window"""
+        from unittest.mock import AsyncMock
+
+        with patch(
+            "app.integrations.supabase.update_worker_scraped_timestamp",
+            new=AsyncMock(),
+        ) as mock_update:
+            batcher = ScrapedTimestampBatcher(window_ms=60_000, max_batch=10)
+            for i in range(10):
+                await batcher.add(f"worker-{i}")
+
+            mock_update.assert_awaited_once()
+            assert len(mock_update.call_args[0][0]) == 10
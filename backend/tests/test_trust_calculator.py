@@ -16,6 +16,8 @@ from app.services.trust_calculator import (
     calculate_review_score,
     calculate_source_score,
     calculate_trust_score,
+    calculate_trust_scores_batch,
+    create_trust_score_from_worker_dict,
     calculate_verification_score,
     determine_trust_level,
     mask_phone_number,
@@ -388,6 +390,49 @@ class TestCompleteTrustScore:
         assert result.trust_level == TrustLevel.MEDIUM
 
 
+class TestBatchTrustScoring:
+    """Test batched trust scoring over worker records"""
+
+    def test_batch_matches_per_row_scoring(self):
+        """Batch results should match per-row scoring for each worker"""
+        workers = [
+            {
+                "source_tier": "google_maps",
+                "gmaps_review_count": 67,
+                "gmaps_rating": 4.8,
+                "gmaps_photos_count": 10,
+                "whatsapp": "+62812345678",
+                "last_scraped_at": datetime.utcnow() - timedelta(days=5),
+            },
+            {
+                "source_tier": "olx",
+                "platform_reviews": 3,
+                "platform_rating": 4.1,
+                "olx_listing_age_days": 45,
+            },
+        ]
+
+        batch_results = calculate_trust_scores_batch(workers)
+        per_row_results = [create_trust_score_from_worker_dict(w) for w in workers]
+
+        assert len(batch_results) == len(workers)
+        for batch, per_row in zip(batch_results, per_row_results):
+            assert batch.total_score == per_row.total_score
+            assert batch.trust_level == per_row.trust_level
+            assert batch.breakdown == per_row.breakdown
+
+    def test_batch_handles_unknown_source_tier(self):
+        """Unknown source tiers should fall back to platform scoring"""
+        results = calculate_trust_scores_batch([{"source_tier": "mystery"}])
+
+        assert results[0].source_tier == SourceTier.PLATFORM
+        assert results[0].breakdown["source"] == 30
+
+    def test_batch_handles_empty_input(self):
+        """Empty batch should return an empty list"""
+        assert calculate_trust_scores_batch([]) == []
+
+
 class TestNameMasking:
     """Test worker name masking for privacy"""
 
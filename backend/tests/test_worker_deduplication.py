@@ -364,6 +364,23 @@ class TestDeduplication:
         deduplicated = deduplicate_workers(workers)
         assert len(deduplicated) == 1
 
+    def test_merges_multi_token_locations(self):
+        """Should merge when a compound location contains the plain area"""
+        workers = [
+            {
+                "business_name": "Bali Pool Service",
+                "location": "North Canggu",
+                "source_tier": "google_maps",
+            },
+            {
+                "business_name": "Bali Pool Services",
+                "location": "Canggu",
+                "source_tier": "olx",
+            },
+        ]
+        deduplicated = deduplicate_workers(workers)
+        assert len(deduplicated) == 1
+
     def test_keeps_different_workers_separate(self):
         """Should not merge clearly different workers"""
         workers = [
@@ -10,6 +10,8 @@ Tests cover:
 - Worker filtering and sorting
 """
 
+from types import MappingProxyType
+
 import pytest
 
 from app.services.trust_calculator import TrustLevel
@@ -26,138 +28,120 @@ from app.services.worker_matcher import (
 )
 
 
-class TestProjectTypeMapping:
-    """Test project type to specialization mapping"""
-
-    def test_maps_pool_projects(self):
-        """Should map all pool variants to 'pool'"""
-        assert map_project_type_to_specialization("pool_construction") == "pool"
-        assert map_project_type_to_specialization("pool_renovation") == "pool"
-        assert map_project_type_to_specialization("swimming_pool") == "pool"
+@pytest.fixture(scope="session")
+def base_rankable():
+    """Canonical rankable worker payload for the ranking tests"""
+    return MappingProxyType({
+        "trust_score": 80,
+        "specializations": ["pool"],
+        "location": "Canggu",
+    })
 
-    def test_maps_bathroom_projects(self):
-        """Should map bathroom variants to 'bathroom'"""
-        assert map_project_type_to_specialization("bathroom_renovation") == "bathroom"
-        assert map_project_type_to_specialization("bathroom_remodel") == "bathroom"
 
-    def test_maps_kitchen_projects(self):
-        """Should map kitchen variants to 'kitchen'"""
-        assert map_project_type_to_specialization("kitchen_renovation") == "kitchen"
-        assert map_project_type_to_specialization("kitchen_remodel") == "kitchen"
+@pytest.fixture
+def rankable(override_factory, base_rankable):
+    """Override factory over the canonical rankable worker"""
+    return override_factory(base_rankable)
 
-    def test_maps_general_construction(self):
-        """Should map general construction types"""
-        assert map_project_type_to_specialization("general_construction") == "general"
-        assert map_project_type_to_specialization("home_renovation") == "general"
-        assert map_project_type_to_specialization("renovation") == "general"
 
-    def test_defaults_to_general(self):
-        """Should default unknown types to 'general'"""
-        assert map_project_type_to_specialization("unknown_type") == "general"
-        assert map_project_type_to_specialization("tile_installation") == "general"
+class TestProjectTypeMapping:
+    """Test project type to specialization mapping"""
 
-    def test_handles_case_insensitivity(self):
-        """Should handle different cases"""
-        assert map_project_type_to_specialization("POOL_CONSTRUCTION") == "pool"
-        assert map_project_type_to_specialization("Pool_Renovation") == "pool"
+    @pytest.mark.parametrize(
+        ("project_type", "expected"),
+        [
+            pytest.param("pool_construction", "pool", id="pool-construction"),
+            pytest.param("pool_renovation", "pool", id="pool-renovation"),
+            pytest.param("swimming_pool", "pool", id="swimming-pool"),
+            pytest.param("bathroom_renovation", "bathroom", id="bathroom-renovation"),
+            pytest.param("bathroom_remodel", "bathroom", id="bathroom-remodel"),
+            pytest.param("kitchen_renovation", "kitchen", id="kitchen-renovation"),
+            pytest.param("kitchen_remodel", "kitchen", id="kitchen-remodel"),
+            pytest.param("general_construction", "general", id="general-construction"),
+            pytest.param("home_renovation", "general", id="home-renovation"),
+            pytest.param("renovation", "general", id="renovation"),
+            pytest.param("unknown_type", "general", id="unknown-defaults-to-general"),
+            pytest.param("tile_installation", "general", id="unmapped-trade"),
+            pytest.param("POOL_CONSTRUCTION", "pool", id="uppercase"),
+            pytest.param("Pool_Renovation", "pool", id="mixed-case"),
+        ],
+    )
+    def test_maps_project_type(self, project_type, expected):
+        """Each project type variant should map to its specialization,
+        defaulting to 'general' and ignoring case"""
+        assert map_project_type_to_specialization(project_type) == expected
 
 
 class TestLocationRelevance:
     """Test location relevance scoring"""
 
-    def test_exact_area_match(self):
-        """Should score 1.0 for exact match"""
-        assert calculate_location_relevance("Canggu", "Canggu") == 1.0
-        assert calculate_location_relevance("Seminyak", "Seminyak") == 1.0
-
-    def test_partial_area_match(self):
-        """Should score 1.0 for partial matches"""
-        assert calculate_location_relevance("Canggu", "Canggu, Bali") == 1.0
-        assert calculate_location_relevance("North Canggu", "Canggu") == 1.0
-
-    def test_same_area_group_match(self):
-        """Should score 0.8 for same area group (South, Central, etc.)"""
-        # Both in South Bali
-        score = calculate_location_relevance("Canggu", "Seminyak")
-        assert score == 0.8
-
-        score = calculate_location_relevance("Kuta", "Jimbaran")
-        assert score == 0.8
-
-    def test_different_area_same_island(self):
-        """Should score 0.5 for different areas"""
-        # Canggu (South) vs Ubud (East)
-        score = calculate_location_relevance("Canggu", "Ubud")
-        assert score == 0.5
-
-        # Seminyak (South) vs Lovina (North)
-        score = calculate_location_relevance("Seminyak", "Lovina")
-        assert score == 0.5
-
-    def test_handles_missing_location(self):
-        """Should score 0.3 for missing location data"""
-        assert calculate_location_relevance("", "Canggu") == 0.3
-        assert calculate_location_relevance("Canggu", "") == 0.3
-        assert calculate_location_relevance(None, "Canggu") == 0.3
-
-    def test_case_insensitive_matching(self):
-        """Should handle case differences"""
-        assert calculate_location_relevance("CANGGU", "canggu") == 1.0
-        assert calculate_location_relevance("Canggu", "CANGGU") == 1.0
+    @pytest.mark.parametrize(
+        ("worker_loc", "requested_loc", "expected"),
+        [
+            pytest.param("Canggu", "Canggu", 1.0, id="exact-match"),
+            pytest.param("Seminyak", "Seminyak", 1.0, id="exact-match-seminyak"),
+            pytest.param("Canggu", "Canggu, Bali", 1.0, id="partial-match-suffix"),
+            pytest.param("North Canggu", "Canggu", 1.0, id="partial-match-prefix"),
+            pytest.param("Canggu", "Seminyak", 0.8, id="same-group-south"),
+            pytest.param("Kuta", "Jimbaran", 0.8, id="same-group-south-kuta"),
+            pytest.param("Canggu", "Ubud", 0.5, id="south-vs-east"),
+            pytest.param("Seminyak", "Lovina", 0.5, id="south-vs-north"),
+            pytest.param("", "Canggu", 0.3, id="empty-worker-location"),
+            pytest.param("Canggu", "", 0.3, id="empty-requested-location"),
+            pytest.param(None, "Canggu", 0.3, id="none-worker-location"),
+            pytest.param("CANGGU", "canggu", 1.0, id="uppercase-worker"),
+            pytest.param("Canggu", "CANGGU", 1.0, id="uppercase-requested"),
+        ],
+    )
+    def test_location_relevance(self, worker_loc, requested_loc, expected):
+        """Exact/partial matches score 1.0, same area group 0.8, different
+        areas 0.5, and missing data 0.3 - case-insensitively"""
+        assert calculate_location_relevance(worker_loc, requested_loc) == expected
 
 
 class TestSpecializationMatch:
     """Test specialization matching logic"""
 
-    def test_exact_specialization_match(self):
-        """Should score 1.0 for exact match"""
-        assert calculate_specialization_match(["pool"], "pool") == 1.0
-        assert calculate_specialization_match(["pool", "general"], "pool") == 1.0
-
-    def test_general_contractor_match(self):
-        """Should score 0.7 for general contractors"""
-        assert calculate_specialization_match(["general"], "pool") == 0.7
-        assert calculate_specialization_match(["general"], "bathroom") == 0.7
-
-    def test_no_relevant_specialization(self):
-        """Should score 0.0 for no match"""
-        assert calculate_specialization_match(["bathroom"], "pool") == 0.0
-        assert calculate_specialization_match(["kitchen"], "pool") == 0.0
-
-    def test_handles_empty_specializations(self):
-        """Should score 0.0 for empty specializations"""
-        assert calculate_specialization_match([], "pool") == 0.0
-        assert calculate_specialization_match(None, "pool") == 0.0
+    @pytest.mark.parametrize(
+        ("specializations", "required", "expected"),
+        [
+            pytest.param(["pool"], "pool", 1.0, id="exact-match"),
+            pytest.param(["pool", "general"], "pool", 1.0, id="exact-beats-general"),
+            pytest.param(["general"], "pool", 0.7, id="general-covers-pool"),
+            pytest.param(["general"], "bathroom", 0.7, id="general-covers-bathroom"),
+            pytest.param(["bathroom"], "pool", 0.0, id="wrong-specialization"),
+            pytest.param(["kitchen"], "pool", 0.0, id="wrong-specialization-kitchen"),
+            pytest.param([], "pool", 0.0, id="empty-list"),
+            pytest.param(None, "pool", 0.0, id="none"),
+        ],
+    )
+    def test_specialization_match(self, specializations, required, expected):
+        """Exact matches score 1.0, general contractors 0.7, and missing or
+        irrelevant specializations 0.0"""
+        assert calculate_specialization_match(specializations, required) == expected
 
 
 class TestBudgetRelevance:
     """Test budget relevance scoring"""
 
-    def test_price_within_budget_range(self):
-        """Should score 1.0 when price is in range"""
-        # Low budget: 0-50M IDR
-        assert calculate_budget_relevance(30_000_000, "low") == 1.0
-        assert calculate_budget_relevance(45_000_000, "low") == 1.0
-
-        # Medium budget: 50-150M IDR
-        assert calculate_budget_relevance(100_000_000, "medium") == 1.0
-
-        # High budget: 150M+ IDR
-        assert calculate_budget_relevance(200_000_000, "high") == 1.0
-
-    def test_price_outside_budget_range(self):
-        """Should score 0.3 when price is out of range"""
-        # Too expensive for low budget
-        assert calculate_budget_relevance(100_000_000, "low") == 0.3
-
-        # Too cheap for high budget (might be suspicious)
-        assert calculate_budget_relevance(30_000_000, "high") == 0.3
-
-    def test_handles_missing_data(self):
-        """Should score 0.5 for missing budget or price data"""
-        assert calculate_budget_relevance(None, "medium") == 0.5
-        assert calculate_budget_relevance(100_000_000, None) == 0.5
-        assert calculate_budget_relevance(None, None) == 0.5
+    @pytest.mark.parametrize(
+        ("price", "budget_range", "expected"),
+        [
+            pytest.param(30_000_000, "low", 1.0, id="low-budget-in-range"),
+            pytest.param(45_000_000, "low", 1.0, id="low-budget-near-edge"),
+            pytest.param(100_000_000, "medium", 1.0, id="medium-budget-in-range"),
+            pytest.param(200_000_000, "high", 1.0, id="high-budget-in-range"),
+            pytest.param(100_000_000, "low", 0.3, id="too-expensive-for-low"),
+            pytest.param(30_000_000, "high", 0.3, id="too-cheap-for-high"),
+            pytest.param(None, "medium", 0.5, id="missing-price"),
+            pytest.param(100_000_000, None, 0.5, id="missing-budget"),
+            pytest.param(None, None, 0.5, id="missing-both"),
+        ],
+    )
+    def test_budget_relevance(self, price, budget_range, expected):
+        """In-range prices score 1.0, out-of-range 0.3, and missing price or
+        budget data a neutral 0.5"""
+        assert calculate_budget_relevance(price, budget_range) == expected
 
 
 class TestOverallRankScore:
@@ -252,27 +236,12 @@ class TestOverallRankScore:
 class TestWorkerRanking:
     """Test full worker ranking workflow"""
 
-    def test_ranks_by_overall_score(self):
+    def test_ranks_by_overall_score(self, rankable):
         """Should rank workers by overall score"""
         workers = [
-            {
-                "business_name": "Medium Trust",
-                "trust_score": 65,
-                "specializations": ["pool"],
-                "location": "Canggu",
-            },
-            {
-                "business_name": "High Trust",
-                "trust_score": 90,
-                "specializations": ["pool"],
-                "location": "Canggu",
-            },
-            {
-                "business_name": "Low Trust",
-                "trust_score": 45,
-                "specializations": ["pool"],
-                "location": "Canggu",
-            },
+            rankable(business_name="Medium Trust", trust_score=65),
+            rankable(business_name="High Trust", trust_score=90),
+            rankable(business_name="Low Trust", trust_score=45),
         ]
 
         ranked = rank_workers(workers, "pool_construction", "Canggu")
@@ -281,12 +250,12 @@ class TestWorkerRanking:
         assert ranked[1]["business_name"] == "Medium Trust"
         assert ranked[2]["business_name"] == "Low Trust"
 
-    def test_filters_by_min_trust_score(self):
+    def test_filters_by_min_trust_score(self, rankable):
         """Should filter out low trust workers"""
         workers = [
-            {"trust_score": 85, "specializations": ["pool"], "location": "Canggu"},
-            {"trust_score": 35, "specializations": ["pool"], "location": "Canggu"},  # Below min
-            {"trust_score": 65, "specializations": ["pool"], "location": "Canggu"},
+            rankable(trust_score=85),
+            rankable(trust_score=35),  # Below min
+            rankable(trust_score=65),
         ]
 
         ranked = rank_workers(
@@ -295,12 +264,9 @@ class TestWorkerRanking:
 
         assert len(ranked) == 2  # Filtered out trust_score=35
 
-    def test_limits_results_to_max(self):
+    def test_limits_results_to_max(self, rankable):
         """Should limit results to max_results"""
-        workers = [
-            {"trust_score": 80 + i, "specializations": ["pool"], "location": "Canggu"}
-            for i in range(20)
-        ]
+        workers = [rankable(trust_score=80 + i) for i in range(20)]
 
         ranked = rank_workers(
             workers, "pool_construction", "Canggu", max_results=5
@@ -308,11 +274,9 @@ class TestWorkerRanking:
 
         assert len(ranked) == 5
 
-    def test_adds_ranking_score_to_workers(self):
+    def test_adds_ranking_score_to_workers(self, rankable):
         """Should add ranking_score field to each worker"""
-        workers = [
-            {"trust_score": 85, "specializations": ["pool"], "location": "Canggu"}
-        ]
+        workers = [rankable(trust_score=85)]
 
         ranked = rank_workers(workers, "pool_construction", "Canggu")
 
@@ -320,42 +284,22 @@ class TestWorkerRanking:
         assert isinstance(ranked[0]["ranking_score"], float)
         assert 0 <= ranked[0]["ranking_score"] <= 100
 
-    def test_prefers_specialists_over_generalists(self):
+    def test_prefers_specialists_over_generalists(self, rankable):
         """Should rank specialists higher than generalists (same trust)"""
         workers = [
-            {
-                "business_name": "General Contractor",
-                "trust_score": 80,
-                "specializations": ["general"],
-                "location": "Canggu",
-            },
-            {
-                "business_name": "Pool Specialist",
-                "trust_score": 80,
-                "specializations": ["pool"],
-                "location": "Canggu",
-            },
+            rankable(business_name="General Contractor", specializations=["general"]),
+            rankable(business_name="Pool Specialist"),
         ]
 
         ranked = rank_workers(workers, "pool_construction", "Canggu")
 
         assert ranked[0]["business_name"] == "Pool Specialist"
 
-    def test_prefers_nearby_workers(self):
+    def test_prefers_nearby_workers(self, rankable):
         """Should rank nearby workers higher (same trust, specialization)"""
         workers = [
-            {
-                "business_name": "Far Worker",
-                "trust_score": 80,
-                "specializations": ["pool"],
-                "location": "Ubud",  # East Bali
-            },
-            {
-                "business_name": "Nearby Worker",
-                "trust_score": 80,
-                "specializations": ["pool"],
-                "location": "Canggu",  # Requested location
-            },
+            rankable(business_name="Far Worker", location="Ubud"),  # East Bali
+            rankable(business_name="Nearby Worker"),  # Requested location
         ]
 
         ranked = rank_workers(workers, "pool_construction", "Canggu")
@@ -367,11 +311,11 @@ class TestWorkerRanking:
         ranked = rank_workers([], "pool_construction", "Canggu")
         assert ranked == []
 
-    def test_maps_project_type_automatically(self):
+    def test_maps_project_type_automatically(self, rankable):
         """Should map project type to specialization"""
         workers = [
-            {"trust_score": 80, "specializations": ["bathroom"], "location": "Canggu"},
-            {"trust_score": 80, "specializations": ["pool"], "location": "Canggu"},
+            rankable(specializations=["bathroom"]),
+            rankable(),
         ]
 
         # Request bathroom renovation (maps to "bathroom")